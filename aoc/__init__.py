@@ -0,0 +1 @@
+"""Shared tooling for the dayNN solvers."""
@@ -0,0 +1,264 @@
+"""
+Single entry point for every solver.
+
+    python -m aoc run 8 1 --iterations 1000 day08/input_large.txt
+    python -m aoc run 1 2 < day01/input_long.txt
+    python -m aoc run 9 2 --engine optimized day09/input_large.txt
+    python -m aoc run-all --timing
+    python -m aoc check 9 2
+    python -m aoc batch 3 2 'inputs/day03/*.txt' --workers 8 --timeout 30
+    python -m aoc run 4 2 day04/input_large.txt --profile day04.folded
+    python -m aoc run 8 2 day08/input_large.txt --memprofile
+    python -m aoc run 8 1 --iterations 10 --no-cache day08/input_large.txt
+    python -m aoc serve --workers 4
+
+Only the module of the requested day/part (and engine) is imported.
+``--timing`` writes the interpreter startup cost and the import, parse and
+solve times to stderr, so stdout carries nothing but answers. ``check``
+runs every engine on small inputs and fails when one disagrees with the
+reference engine.
+
+Answers and expensive intermediates are cached on disk by input content
+(see ``aoc.cache``); ``--no-cache`` bypasses the cache.
+
+``--profile FILE`` turns on the solvers' spans and counters (see
+``aoc.instrument``), writes the collapsed stacks for a flame graph to FILE
+and prints a summary table on stderr. ``--memprofile`` reports the
+tracemalloc peak and top allocation sites on stderr. Profiled runs skip the
+cache.
+
+``serve`` keeps every solver module loaded in a pool of worker processes
+behind a Unix socket (see ``aoc.server``); ``python -m aoc.client`` is the
+drop-in replacement for ``run`` that talks to it.
+"""
+
+import argparse
+import functools
+import json
+import sys
+import time
+from typing import Any
+
+from aoc import instrument
+from aoc.cache import Cache
+from aoc.memprofile import format_report, profile_memory
+from aoc.registry import SOLVERS, get_solver
+from aoc.runner import RunResult, check_engines, run_solver
+
+
+def format_timing(label: str, result: RunResult) -> str:
+    return (
+        f"{label} [{result.engine}]: import {result.import_time * 1000:.1f} ms,"
+        f" parse {result.parse_time * 1000:.1f} ms,"
+        f" solve {result.solve_time * 1000:.1f} ms"
+    )
+
+
+def solver_params(args: argparse.Namespace) -> dict[str, Any]:
+    params = {}
+    if args.iterations is not None:
+        params["iterations"] = args.iterations
+    return params
+
+
+def open_cache(args: argparse.Namespace) -> Cache | None:
+    return None if args.no_cache or args.profile or args.memprofile else Cache()
+
+
+def command_run(args: argparse.Namespace) -> None:
+    try:
+        solver = get_solver(args.day, args.part)
+        solve = functools.partial(
+            run_solver, solver, args.input, solver_params(args), args.engine, open_cache(args)
+        )
+        if args.memprofile:
+            result, memory = profile_memory(solve)
+            print(format_report(memory), file=sys.stderr)
+        else:
+            result = solve()
+    except ValueError as e:
+        sys.exit(str(e))
+
+    print(result.answer)
+
+    if args.timing:
+        print(format_timing(solver.key, result), file=sys.stderr)
+
+
+def command_run_all(args: argparse.Namespace) -> None:
+    cache = open_cache(args)
+    total = 0.0
+    for solver in SOLVERS.values():
+        result = run_solver(solver, solver.input_path, cache=cache)
+        print(f"{solver.key} {result.answer}", flush=True)
+
+        total += result.import_time + result.parse_time + result.solve_time
+        if args.timing:
+            print(format_timing(solver.key, result), file=sys.stderr)
+
+    if args.timing:
+        print(f"total: {total * 1000:.1f} ms", file=sys.stderr)
+
+
+def command_batch(args: argparse.Namespace) -> None:
+    from aoc.batch import expand_inputs, run_batch
+
+    try:
+        solver = get_solver(args.day, args.part)
+    except ValueError as e:
+        sys.exit(str(e))
+
+    paths = expand_inputs(args.inputs)
+    failures = []
+    for result in run_batch(
+        solver,
+        paths,
+        workers=args.workers,
+        timeout=args.timeout,
+        params=solver_params(args),
+        engine=args.engine,
+        use_cache=not args.no_cache,
+    ):
+        print(json.dumps(result, default=str), flush=True)
+        if not result["ok"]:
+            failures.append(result)
+
+    print(f"{len(paths) - len(failures)} solved, {len(failures)} failed", file=sys.stderr)
+    for failure in failures:
+        print(f"  {failure['input']}: {failure['error']}", file=sys.stderr)
+
+    if failures:
+        sys.exit(1)
+
+
+def command_serve(args: argparse.Namespace) -> None:
+    from aoc.server import serve
+
+    try:
+        serve(args.socket, args.workers, use_cache=not args.no_cache)
+    except ValueError as e:
+        sys.exit(str(e))
+
+
+def command_check(args: argparse.Namespace) -> None:
+    solvers = [
+        solver
+        for solver in SOLVERS.values()
+        if (args.day is None or solver.day == args.day)
+        and (args.part is None or solver.part == args.part)
+    ]
+
+    mismatches = 0
+    for solver in solvers:
+        checks: list[tuple[str, dict[str, Any]]]
+        if args.input:
+            checks = [(path, {}) for path in args.input]
+        elif solver.sample_path is not None:
+            checks = [(str(solver.sample_path), solver.sample_params)]
+        else:
+            continue
+
+        for path, params in checks:
+            answers = check_engines(solver, path, params)
+            reference = answers["reference"]
+            for engine, answer in answers.items():
+                status = "ok" if answer == reference else "MISMATCH"
+                mismatches += answer != reference
+                print(f"{solver.key} {engine:<12} {answer} {status}")
+
+    if mismatches:
+        sys.exit(1)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m aoc")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="solve one day/part")
+    run.add_argument("day", type=int)
+    run.add_argument("part", type=int)
+    run.add_argument("input", nargs="?", help="input file (default: stdin)")
+    run.add_argument("--iterations", type=int, help="day 8 part 1 connections")
+    run.add_argument("--engine", help="force this engine instead of selecting by size")
+    run.add_argument(
+        "--memprofile", action="store_true", help="report tracemalloc peak and top sites"
+    )
+    run.set_defaults(handler=command_run)
+
+    run_all = subparsers.add_parser(
+        "run-all", help="solve every day/part on its bundled input in one process"
+    )
+    run_all.set_defaults(handler=command_run_all, memprofile=False)
+
+    batch = subparsers.add_parser(
+        "batch", help="solve many inputs in a process pool, one JSON line each"
+    )
+    batch.add_argument("day", type=int)
+    batch.add_argument("part", type=int)
+    batch.add_argument("inputs", nargs="+", help="files, directories or glob patterns")
+    batch.add_argument("--workers", type=int, help="pool size (default: CPU count)")
+    batch.add_argument("--timeout", type=float, help="seconds allowed per file")
+    batch.add_argument("--iterations", type=int, help="day 8 part 1 connections")
+    batch.add_argument("--engine", help="force this engine instead of selecting by size")
+    batch.add_argument("--no-cache", action="store_true", help="bypass the on-disk cache")
+    batch.set_defaults(handler=command_batch, timing=False, profile=None, memprofile=False)
+
+    check = subparsers.add_parser(
+        "check", help="compare every engine with the reference on small inputs"
+    )
+    check.add_argument("day", type=int, nargs="?")
+    check.add_argument("part", type=int, nargs="?")
+    check.add_argument(
+        "--input", nargs="+", help="inputs to check (default: the bundled sample)"
+    )
+    check.set_defaults(handler=command_check, timing=False, profile=None, memprofile=False)
+
+    serve = subparsers.add_parser(
+        "serve", help="keep all solvers loaded and answer requests on a Unix socket"
+    )
+    serve.add_argument("--socket", help="socket path (default: $AOC_SOCKET)")
+    serve.add_argument("--workers", type=int, help="pool size (default: CPU count)")
+    serve.add_argument("--no-cache", action="store_true", help="bypass the on-disk cache")
+    serve.set_defaults(handler=command_serve, timing=False, profile=None, memprofile=False)
+
+    for subparser in (run, run_all):
+        subparser.add_argument(
+            "--timing", action="store_true", help="report stage timings on stderr"
+        )
+        subparser.add_argument(
+            "--profile", metavar="FILE", help="write collapsed stacks of solver spans"
+        )
+        subparser.add_argument(
+            "--no-cache", action="store_true", help="bypass the on-disk cache"
+        )
+
+    # an input path may follow the options, which argparse only supports for
+    # a parser without subcommands, so the chosen command parses on its own
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] in subparsers.choices:
+        command = subparsers.choices[argv[0]]
+        return command.parse_intermixed_args(argv[1:], argparse.Namespace(command=argv[0]))
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    # CPU time spent before we get here is interpreter startup plus our imports
+    startup_time = time.process_time()
+    args = parse_args(argv)
+
+    if args.timing:
+        print(f"startup: {startup_time * 1000:.1f} ms", file=sys.stderr)
+
+    if args.profile:
+        instrument.enable()
+
+    args.handler(args)
+
+    if args.profile:
+        instrument.write_folded(args.profile)
+        print(instrument.summary(), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
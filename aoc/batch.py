@@ -0,0 +1,160 @@
+"""
+Solve many input files of one day/part across a process pool.
+
+Workers import the engine modules once when they start. Every file gets its
+own timeout, enforced inside the worker with an interval timer, and a
+failing file is reported without stopping the rest of the batch.
+
+A worker that dies breaks the whole pool. Workers announce every file they
+start, so the files that were in flight are known; the others go to a fresh
+pool, and the in-flight files are rerun one by one on their own so that only
+the file that kills its worker is reported as failed.
+"""
+
+import glob
+import os
+import signal
+import time
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import SimpleQueue
+from pathlib import Path
+from typing import Any
+
+from aoc.cache import Cache
+from aoc.registry import Solver
+from aoc.runner import run_solver
+
+_worker_cache: Cache | None = None
+_started: "SimpleQueue[str] | None" = None
+
+
+class SolveTimeout(Exception):
+    pass
+
+
+def expand_inputs(patterns: list[str]) -> list[str]:
+    """Turn files, directories and glob patterns into a sorted list of files."""
+    paths: set[str] = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths.update(str(path) for path in Path(pattern).iterdir() if path.is_file())
+        elif os.path.exists(pattern):
+            paths.add(pattern)
+        else:
+            paths.update(path for path in glob.glob(pattern) if os.path.isfile(path))
+    return sorted(paths)
+
+
+def _init_worker(solver: Solver, use_cache: bool, started: "SimpleQueue[str]") -> None:
+    global _worker_cache, _started
+
+    # the parent handles Ctrl+C and shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    for engine in solver.all_engines:
+        if engine.is_available():
+            engine.load()
+
+    _worker_cache = Cache() if use_cache else None
+    _started = started
+
+
+def _raise_timeout(signum: int, frame: Any) -> None:
+    raise SolveTimeout()
+
+
+def _solve_file(
+    solver: Solver,
+    path: str,
+    params: dict[str, Any],
+    engine: str | None,
+    timeout: float | None,
+) -> dict[str, Any]:
+    if timeout:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    if _started is not None:
+        # written straight to the pipe, so it survives the worker dying
+        _started.put(path)
+
+    start = time.perf_counter()
+    try:
+        result = run_solver(solver, path, params, engine, _worker_cache)
+    except SolveTimeout:
+        return {"input": path, "ok": False, "error": f"timed out after {timeout}s"}
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return {"input": path, "ok": False, "error": f"{type(e).__name__}: {e}"}
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    return {
+        "input": path,
+        "ok": True,
+        "answer": result.answer,
+        "engine": result.engine,
+        "time": time.perf_counter() - start,
+    }
+
+
+def _drain(queue: "SimpleQueue[str]") -> set[str]:
+    items = set()
+    while not queue.empty():
+        items.add(queue.get())
+    return items
+
+
+def run_batch(
+    solver: Solver,
+    paths: list[str],
+    workers: int | None = None,
+    timeout: float | None = None,
+    params: dict[str, Any] | None = None,
+    engine: str | None = None,
+    use_cache: bool = True,
+) -> Iterator[dict[str, Any]]:
+    """Yield one result dict per input file, in completion order."""
+    remaining = list(paths)
+    while remaining:
+        started: "SimpleQueue[str]" = SimpleQueue()
+        finished: set[str] = set()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(solver, use_cache, started)
+        ) as pool:
+            pending: dict[Future[dict[str, Any]], str] = {
+                pool.submit(_solve_file, solver, path, params or {}, engine, timeout): path
+                for path in remaining
+            }
+
+            broken = False
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool:
+                        broken = True
+                        continue
+                    finished.add(path)
+                    yield result
+
+        if not broken:
+            return
+
+        in_flight = _drain(started) - finished
+        remaining = [path for path in remaining if path not in finished | in_flight]
+        if not in_flight:
+            # nothing ran, so the pool itself is failing, e.g. in its initializer
+            for path in remaining:
+                yield {"input": path, "ok": False, "error": "worker process died"}
+            return
+
+        if len(in_flight) == 1:
+            yield {"input": in_flight.pop(), "ok": False, "error": "worker process died"}
+        else:
+            for path in sorted(in_flight):
+                yield from run_batch(solver, [path], 1, timeout, params, engine, use_cache)
@@ -0,0 +1,331 @@
+"""
+Benchmark every day/part solver on its bundled large input.
+
+Each solver runs in a fresh process so its peak RSS is not polluted by the
+solvers measured before it. Parse and solve are timed separately; solvers
+that parse lazily (day01) do most of their decoding inside ``solve``.
+
+``--memprofile`` adds one extra run per solver under tracemalloc and stores
+its peak and top allocation sites in the same JSON, where ``--compare``
+checks the traced peak like the timings.
+
+With ``--sweep`` the solvers run on generated inputs (see ``aoc.generate``)
+at every given scale instead, and ``--plot`` draws time and memory against
+the input size.
+
+Usage: python -m aoc.bench [--days 1 4] [--repeat 5] [--compare old.json]
+       python -m aoc.bench --days 8 --sweep 1 2 4 --plot day08.png
+"""
+
+import argparse
+import json
+import platform
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any
+
+from aoc.generate import scaled_size, write_input
+from aoc.memprofile import format_report, profile_memory
+from aoc.registry import SOLVERS, Solver
+from aoc.runner import run_solver
+
+DEFAULT_OUTPUT = "bench_results.json"
+DEFAULT_INPUTS_DIR = "bench_inputs"
+
+# timings below this many seconds are too noisy to call a regression
+NOISE_FLOOR = 0.001
+
+
+def peak_rss_kib() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports KiB
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+    }
+
+
+def measure(
+    solver: Solver,
+    warmup: int,
+    repetitions: int,
+    input_path: str | None = None,
+    engine: str | None = None,
+    memprofile: bool = False,
+) -> dict[str, Any]:
+    """Time one solver in the current process."""
+    source = input_path or solver.input_path
+    results = [
+        run_solver(solver, source, engine=engine) for _ in range(warmup + repetitions)
+    ]
+    measured = results[warmup:]
+    # before the tracemalloc run, whose bookkeeping would inflate the peak
+    peak_rss = peak_rss_kib()
+
+    memory = None
+    if memprofile:
+        _, memory = profile_memory(lambda: run_solver(solver, source, engine=engine))
+
+    return {
+        "engine": results[-1].engine,
+        "input": str(source),
+        "params": solver.params,
+        "answer": results[-1].answer,
+        "import": results[0].import_time,
+        "parse": summarize([result.parse_time for result in measured]),
+        "solve": summarize([result.solve_time for result in measured]),
+        "peak_rss_kib": peak_rss,
+        "memory": memory,
+    }
+
+
+def measure_isolated(
+    solver: Solver,
+    warmup: int,
+    repetitions: int,
+    input_path: str | None = None,
+    engine: str | None = None,
+    memprofile: bool = False,
+) -> dict[str, Any]:
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(
+            measure, solver, warmup, repetitions, input_path, engine, memprofile
+        ).result()
+
+
+def report_line(key: str, result: dict[str, Any]) -> None:
+    print(
+        f"{key:<12} parse {result['parse']['median'] * 1000:>10.3f} ms"
+        f"  solve {result['solve']['median'] * 1000:>10.3f} ms"
+        f"  rss {result['peak_rss_kib'] / 1024:>8.1f} MiB"
+        f"  [{result['engine']}]",
+        flush=True,
+    )
+    if result["memory"]:
+        print(format_report(result["memory"]), flush=True)
+
+
+def run(
+    solvers: list[Solver],
+    warmup: int,
+    repetitions: int,
+    engine: str | None = None,
+    memprofile: bool = False,
+) -> dict[str, dict[str, Any]]:
+    results = {}
+    for solver in solvers:
+        result = measure_isolated(
+            solver, warmup, repetitions, engine=engine, memprofile=memprofile
+        )
+        results[solver.key] = result
+        report_line(solver.key, result)
+    return results
+
+
+def sweep(
+    solvers: list[Solver],
+    scales: list[int],
+    seed: int,
+    inputs_dir: Path,
+    warmup: int,
+    repetitions: int,
+    engine: str | None = None,
+    memprofile: bool = False,
+) -> dict[str, dict[str, Any]]:
+    """
+    Measure every solver on generated inputs of increasing size. Generated
+    files are kept in ``inputs_dir`` and reused by later sweeps.
+    """
+    inputs_dir.mkdir(parents=True, exist_ok=True)
+    results = {}
+
+    for scale in scales:
+        for solver in solvers:
+            path = inputs_dir / f"day{solver.day:02d}_x{scale}_s{seed}.txt"
+            if not path.exists():
+                write_input(solver.day, scale, seed, path)
+
+            result = measure_isolated(
+                solver, warmup, repetitions, str(path), engine, memprofile
+            )
+            result["scale"] = scale
+            result["n"] = scaled_size(solver.day, scale)
+            result["bytes"] = path.stat().st_size
+
+            key = f"{solver.key}@x{scale}"
+            results[key] = result
+            report_line(key, result)
+
+    return results
+
+
+def plot(results: dict[str, dict[str, Any]], path: str) -> None:
+    """Plot solve time and peak RSS against input size, one line per solver."""
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError as e:
+        raise SystemExit("--plot requires matplotlib") from e
+
+    series: dict[str, list[dict[str, Any]]] = {}
+    for key, result in results.items():
+        series.setdefault(key.split("@")[0], []).append(result)
+
+    figure, (time_axis, memory_axis) = plt.subplots(1, 2, figsize=(12, 5))
+    for key, points in sorted(series.items()):
+        points.sort(key=lambda point: point["n"])
+        ns = [point["n"] for point in points]
+        time_axis.plot(ns, [point["solve"]["median"] for point in points], marker="o", label=key)
+        memory_axis.plot(ns, [point["peak_rss_kib"] / 1024 for point in points], marker="o", label=key)
+
+    time_axis.set(xscale="log", yscale="log", xlabel="n", ylabel="solve time (s)")
+    memory_axis.set(xscale="log", yscale="log", xlabel="n", ylabel="peak RSS (MiB)")
+    time_axis.legend()
+    figure.tight_layout()
+    figure.savefig(path)
+
+
+def find_regressions(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """
+    >>> old = {"results": {"01.1": {"answer": 3, "parse": {"median": 0.5}, "solve": {"median": 1.0}, "peak_rss_kib": 100}}}
+    >>> new = {"results": {"01.1": {"answer": 3, "parse": {"median": 0.5}, "solve": {"median": 1.5}, "peak_rss_kib": 100}}}
+    >>> find_regressions(new, old, 0.1)
+    ['01.1 solve: 1.0000s -> 1.5000s (+50.0%)']
+    >>> old["results"]["01.1"]["parse"]["median"] = 0.0
+    >>> find_regressions(new, old, 0.1)
+    ['01.1 parse: 0.0000s -> 0.5000s (n/a)', '01.1 solve: 1.0000s -> 1.5000s (+50.0%)']
+    """
+    regressions = []
+
+    for key, result in current["results"].items():
+        previous = baseline["results"].get(key)
+        if previous is None:
+            continue
+
+        if result["answer"] != previous["answer"]:
+            regressions.append(
+                f"{key} answer changed: {previous['answer']} -> {result['answer']}"
+            )
+
+        for stage in ("parse", "solve"):
+            old, new = previous[stage]["median"], result[stage]["median"]
+            if new - old > max(old * threshold, NOISE_FLOOR):
+                # lazy parsers (day01) can have a median of zero
+                change = f"+{(new / old - 1) * 100:.1f}%" if old else "n/a"
+                regressions.append(f"{key} {stage}: {old:.4f}s -> {new:.4f}s ({change})")
+
+        old_rss, new_rss = previous["peak_rss_kib"], result["peak_rss_kib"]
+        if new_rss > old_rss * (1 + threshold):
+            regressions.append(f"{key} peak rss: {old_rss} KiB -> {new_rss} KiB")
+
+        if result.get("memory") and previous.get("memory"):
+            old_peak = previous["memory"]["peak_kib"]
+            new_peak = result["memory"]["peak_kib"]
+            if new_peak > old_peak * (1 + threshold):
+                regressions.append(
+                    f"{key} traced peak: {old_peak:.1f} KiB -> {new_peak:.1f} KiB"
+                )
+
+    return regressions
+
+
+def metadata(warmup: int, repetitions: int) -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "warmup": warmup,
+        "repetitions": repetitions,
+    }
+
+
+def select_solvers(days: list[int] | None) -> list[Solver]:
+    return [
+        solver for solver in SOLVERS.values() if days is None or solver.day in days
+    ]
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m aoc.bench")
+    parser.add_argument("--days", type=int, nargs="+", help="only these days")
+    parser.add_argument("--engine", help="force this engine instead of selecting by size")
+    parser.add_argument(
+        "--memprofile",
+        action="store_true",
+        help="also record tracemalloc peak and top allocation sites",
+    )
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--compare", help="previous results to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown that fails the run (default: 0.1)",
+    )
+    parser.add_argument(
+        "--sweep",
+        type=int,
+        nargs="+",
+        metavar="SCALE",
+        help="run on generated inputs at these size multipliers",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--inputs-dir", type=Path, default=Path(DEFAULT_INPUTS_DIR))
+    parser.add_argument("--plot", help="with --sweep, save a time/memory plot")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    solvers = select_solvers(args.days)
+
+    if args.sweep:
+        results = sweep(
+            solvers,
+            args.sweep,
+            args.seed,
+            args.inputs_dir,
+            args.warmup,
+            args.repeat,
+            args.engine,
+            args.memprofile,
+        )
+    else:
+        results = run(solvers, args.warmup, args.repeat, args.engine, args.memprofile)
+
+    report = {"meta": metadata(args.warmup, args.repeat), "results": results}
+    Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.sweep and args.plot:
+        plot(results, args.plot)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = find_regressions(report, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Compare the shared input decoders against the per-day ``readlines()``
+parsers they replaced.
+
+Usage: python -m aoc.bench_input [repetitions]
+"""
+
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from aoc.input import (
+    decode_digits,
+    decode_grid,
+    decode_int_tuples,
+    decode_moves,
+    decode_ranges,
+    read_input,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _read_lines(path: Path) -> list[str]:
+    with open(path, "r", encoding="utf-8") as file:
+        return file.readlines()
+
+
+def legacy_lines(path: Path) -> list[str]:
+    return [line.strip() for line in _read_lines(path)]
+
+
+def legacy_ranges(path: Path) -> list[tuple[int, int]]:
+    with open(path, "r", encoding="utf-8") as file:
+        data = file.readline().strip()
+    return [tuple(map(int, id_range.split("-"))) for id_range in data.split(",")]  # type: ignore
+
+
+def legacy_digits(path: Path) -> list[list[int]]:
+    return [[int(digit) for digit in line.strip()] for line in _read_lines(path)]
+
+
+def legacy_grid(path: Path) -> list[list[str]]:
+    return [[char for char in line.strip()] for line in _read_lines(path)]
+
+
+def legacy_int_tuples(path: Path) -> list[tuple[int, ...]]:
+    return [tuple(map(int, line.strip().split(","))) for line in _read_lines(path)]
+
+
+CASES: list[tuple[str, str, Callable[[Path], Any], Callable[[Path], Any]]] = [
+    ("moves", "day01/input_long.txt", legacy_lines, lambda p: decode_moves(read_input(p))),
+    ("ranges", "day02/input_long.txt", legacy_ranges, lambda p: decode_ranges(read_input(p))),
+    ("digits", "day03/input_large.txt", legacy_digits, lambda p: decode_digits(read_input(p))),
+    ("grid", "day04/input_large.txt", legacy_grid, lambda p: decode_grid(read_input(p))),
+    ("int tuples", "day08/input_large.txt", legacy_int_tuples, lambda p: decode_int_tuples(read_input(p))),
+]
+
+
+def measure(parser: Callable[[Path], Any], path: Path, repetitions: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        parser(path)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = parser(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return best, peak
+
+
+def main() -> None:
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    print(f"{'format':<12} {'legacy ms':>10} {'shared ms':>10} {'legacy KiB':>11} {'shared KiB':>11}")
+    for name, relative_path, legacy, shared in CASES:
+        path = ROOT / relative_path
+        legacy_time, legacy_peak = measure(legacy, path, repetitions)
+        shared_time, shared_peak = measure(shared, path, repetitions)
+        print(
+            f"{name:<12} {legacy_time * 1000:>10.3f} {shared_time * 1000:>10.3f}"
+            f" {legacy_peak / 1024:>11.1f} {shared_peak / 1024:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
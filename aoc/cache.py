@@ -0,0 +1,161 @@
+"""
+Content-addressed on-disk cache for answers and expensive intermediates.
+
+Entries are pickles named by the SHA-256 of their key, so the same input
+content hits the cache whatever file it was read from. Reading an entry
+bumps its modification time and writes evict the least recently used
+entries once the directory grows past ``max_bytes``.
+
+Solver code opts in per function with ``@artifact(name)``. The decorator
+does nothing unless the runner has activated a cache with ``use_cache``.
+
+Every key carries the ``code_version`` of the module that computed the
+entry, so editing a solver makes its old entries unreachable; they age out
+through eviction. Changes to shared code a solver depends on are not seen
+by the hash, and bump ``CACHE_VERSION`` instead.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+from aoc.input import Buffer
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# bump when shared code changes what any solver computes
+CACHE_VERSION = 1
+
+MISSING = object()
+_active: "Cache | None" = None
+
+
+def default_directory() -> Path:
+    if directory := os.environ.get("AOC_CACHE_DIR"):
+        return Path(directory)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "aoc"
+
+
+def hash_bytes(data: Buffer) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@functools.cache
+def code_version(module: str) -> str:
+    """``CACHE_VERSION`` and a hash of the source of ``module``."""
+    try:
+        spec = find_spec(module)
+    except (ImportError, ValueError):
+        spec = None
+    origin = spec.origin if spec is not None else None
+    try:
+        with open(origin, "rb") as file:  # type: ignore[arg-type]
+            source = file.read()
+    except (TypeError, OSError):
+        source = b""
+    return f"{CACHE_VERSION}:{hash_bytes(source)}"
+
+
+class Cache:
+    def __init__(
+        self, directory: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.directory = directory or default_directory()
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: tuple[Any, ...]) -> Path:
+        digest = hashlib.sha256(pickle.dumps(key, protocol=5)).hexdigest()
+        return self.directory / f"{digest}.pickle"
+
+    def get(self, key: tuple[Any, ...]) -> Any:
+        """Return the cached value or ``MISSING``."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return MISSING
+
+        os.utime(path)
+        return value
+
+    def put(self, key: tuple[Any, ...], value: Any) -> None:
+        path = self._path(key)
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as file:
+            pickle.dump(value, file, protocol=5)
+        os.replace(file.name, path)
+        self.evict()
+
+    def get_or_compute(self, key: tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+        value = self.get(key)
+        if value is MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def evict(self) -> None:
+        """Drop least recently used entries until the cache fits ``max_bytes``."""
+        entries = []
+        total = 0
+        for path in self.directory.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+@contextmanager
+def use_cache(cache: Cache | None) -> Iterator[None]:
+    """Make ``cache`` available to ``@artifact`` functions for the duration."""
+    global _active
+    previous, _active = _active, cache
+    try:
+        yield
+    finally:
+        _active = previous
+
+
+def artifact[**P, R](name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Cache the result of a pure function under ``name`` and the content of its
+    arguments. Callers get a fresh copy and may mutate it.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            cache = _active
+            if cache is None:
+                return func(*args, **kwargs)
+
+            key = (
+                "artifact",
+                name,
+                code_version(func.__module__),
+                hash_bytes(pickle.dumps((args, kwargs), protocol=5)),
+            )
+            return cache.get_or_compute(key, lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,87 @@
+"""
+Thin client for the warm solver server (``python -m aoc serve``).
+
+    python -m aoc.client 1 2 day01/input_long.txt
+    python -m aoc.client 1 2 < day01/input_long.txt
+    python -m aoc.client 8 1 --iterations 1000 day08/input_large.txt
+
+Takes the same arguments as ``python -m aoc run`` and prints the same answer,
+but only imports the standard library, so nearly all of the cost is the
+solve itself. Files are passed to the server by path, stdin is sent as
+bytes.
+
+The wire format is one JSON header line per connection, optionally followed
+by ``size`` bytes of input, answered by one JSON line.
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+from typing import Any
+
+
+def default_socket_path() -> str:
+    if path := os.environ.get("AOC_SOCKET"):
+        return path
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(runtime_dir, "aoc.sock")
+    return f"/tmp/aoc-{os.getuid()}.sock"
+
+
+def request(
+    socket_path: str, header: dict[str, Any], data: bytes | None = None
+) -> dict[str, Any]:
+    if data is not None:
+        header = {**header, "size": len(data)}
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        with sock.makefile("rwb") as stream:
+            stream.write(json.dumps(header).encode() + b"\n")
+            if data is not None:
+                stream.write(data)
+            stream.flush()
+            return json.loads(stream.readline())
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m aoc.client")
+    parser.add_argument("day", type=int)
+    parser.add_argument("part", type=int)
+    parser.add_argument("input", nargs="?", help="input file (default: stdin)")
+    parser.add_argument("--iterations", type=int, help="day 8 part 1 connections")
+    parser.add_argument("--engine", help="force this engine instead of selecting by size")
+    parser.add_argument("--socket", default=default_socket_path(), help="server socket")
+    # the input path may follow the options, as in the examples above
+    return parser.parse_intermixed_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    header: dict[str, Any] = {"day": args.day, "part": args.part, "engine": args.engine}
+    if args.iterations is not None:
+        header["params"] = {"iterations": args.iterations}
+
+    data = None
+    if args.input is None:
+        data = sys.stdin.buffer.read()
+    else:
+        # the server has its own working directory
+        header["path"] = os.path.abspath(args.input)
+
+    try:
+        response = request(args.socket, header, data)
+    except (FileNotFoundError, ConnectionRefusedError):
+        sys.exit(f"no server at {args.socket}, start one with: python -m aoc serve")
+
+    if not response["ok"]:
+        sys.exit(response["error"])
+
+    print(response["answer"])
+
+
+if __name__ == "__main__":
+    main()
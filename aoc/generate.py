@@ -0,0 +1,234 @@
+"""
+Reproducible synthetic inputs for scaling studies.
+
+Every generator takes the logical size ``n`` (moves, ranges, banks, grid
+cells, boxes or polygon vertices) and a seeded ``random.Random`` and yields
+the input in chunks, so the text of even 1000x inputs is never held in
+memory at once; only day 9 keeps its vertex coordinates, as ints.
+``BASE_SIZES`` is roughly the size of the bundled input, i.e. scale 1.
+
+Usage: python -m aoc.generate DAY [--scale 10] [--seed 0] [-o FILE]
+"""
+
+import argparse
+import itertools
+import math
+import random
+import sys
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+type Generator = Callable[[int, random.Random], Iterator[bytes]]
+
+LINES_PER_CHUNK = 10_000
+
+
+def _batched(lines: Iterator[str]) -> Iterator[bytes]:
+    batch: list[str] = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) == LINES_PER_CHUNK:
+            yield ("\n".join(batch) + "\n").encode()
+            batch.clear()
+    if batch:
+        yield ("\n".join(batch) + "\n").encode()
+
+
+def _side(cells: int) -> int:
+    return max(3, math.isqrt(cells))
+
+
+def generate_day01(n: int, rng: random.Random) -> Iterator[bytes]:
+    """Rotation log of ``n`` moves."""
+    return _batched(f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(n))
+
+
+def generate_day02(n: int, rng: random.Random) -> Iterator[bytes]:
+    """``n`` comma-separated ID ranges on a single line."""
+    separator = ""
+    for start in range(0, n, LINES_PER_CHUNK):
+        ranges = []
+        for _ in range(min(LINES_PER_CHUNK, n - start)):
+            digits = rng.randint(1, 10)
+            lower_bound = rng.randint(10 ** (digits - 1), 10**digits - 1)
+            ranges.append(f"{lower_bound}-{lower_bound + rng.randint(0, 140_000)}")
+        yield (separator + ",".join(ranges)).encode()
+        separator = ","
+    yield b"\n"
+
+
+def generate_day03(n: int, rng: random.Random) -> Iterator[bytes]:
+    """``n`` battery banks of 100 digits."""
+    return _batched(
+        "".join(rng.choices("123456789", k=100)) for _ in range(n)
+    )
+
+
+def generate_day04(n: int, rng: random.Random) -> Iterator[bytes]:
+    """Square warehouse of about ``n`` cells, 65% of them rolls."""
+    side = _side(n)
+    return _batched(
+        "".join(rng.choices(".@", weights=(35, 65), k=side)) for _ in range(side)
+    )
+
+
+def generate_day05(n: int, rng: random.Random) -> Iterator[bytes]:
+    """``n`` fresh ranges followed by ``5 * n`` ingredient IDs."""
+    upper = 560_000_000_000_000
+
+    def lines() -> Iterator[str]:
+        for _ in range(n):
+            start = rng.randint(1, upper)
+            yield f"{start}-{start + rng.randint(0, 5_000_000_000_000)}"
+        yield ""
+        for _ in range(5 * n):
+            yield str(rng.randint(1, upper))
+
+    return _batched(lines())
+
+
+def generate_day06(n: int, rng: random.Random) -> Iterator[bytes]:
+    """
+    ``n`` column-aligned problems of four numbers each. Numbers are ordered by
+    length so every digit column reads top to bottom without gaps.
+
+    Every problem spans all five lines, so the problems are generated once
+    per line from the same random state and only that line's cells are kept.
+    """
+    state = rng.getstate()
+
+    def cells(line: int) -> Iterator[str]:
+        rng.setstate(state)
+        for _ in range(n):
+            numbers = [str(rng.randint(1, 10 ** rng.randint(1, 4) - 1)) for _ in range(4)]
+            numbers.sort(key=len, reverse=rng.random() < 0.5)
+            width = max(len(number) for number in numbers)
+            align = str.rjust if rng.random() < 0.5 else str.ljust
+            operator = rng.choice("+*")
+            yield operator.ljust(width) if line == 4 else align(numbers[line], width)
+
+    for line in range(5):
+        separator = ""
+        for chunk in itertools.batched(cells(line), LINES_PER_CHUNK):
+            yield (separator + " ".join(chunk)).encode()
+            separator = " "
+        yield b"\n"
+
+
+def generate_day07(n: int, rng: random.Random) -> Iterator[bytes]:
+    """Tachyon manifold of about ``n`` cells with splitters on every other row."""
+    side = _side(n) | 1
+
+    def lines() -> Iterator[str]:
+        yield "." * (side // 2) + "S" + "." * (side // 2)
+        for y in range(1, side + 1):
+            if y % 2:
+                yield "." * side
+            else:
+                yield "".join(rng.choices(".^", weights=(9, 1), k=side))
+
+    return _batched(lines())
+
+
+def generate_day08(n: int, rng: random.Random) -> Iterator[bytes]:
+    """``n`` junction boxes in a 100k cube."""
+    return _batched(
+        f"{rng.randint(0, 99_999)},{rng.randint(0, 99_999)},{rng.randint(0, 99_999)}"
+        for _ in range(n)
+    )
+
+
+def generate_day09(n: int, rng: random.Random) -> Iterator[bytes]:
+    """
+    Rectilinear polygon with about ``n`` vertices: a random skyline on top
+    and a random upside-down skyline below it. The lower skyline is written
+    right to left, so the coordinates are kept as ints until then.
+    """
+    columns = max(2, n // 4)
+    extent = max(100_000, 4 * columns)
+    xs = sorted(rng.sample(range(1, extent), columns + 1))
+    middle = extent // 2
+
+    def heights(low: int, high: int) -> list[int]:
+        values = [rng.randint(low, high)]
+        while len(values) < columns:
+            value = rng.randint(low, high)
+            if value != values[-1]:
+                values.append(value)
+        return values
+
+    tops = heights(middle + 1, extent)
+    bottoms = heights(1, middle - 1)
+
+    def lines() -> Iterator[str]:
+        for i, top in enumerate(tops):
+            yield f"{xs[i]},{top}"
+            yield f"{xs[i + 1]},{top}"
+        for i in reversed(range(columns)):
+            yield f"{xs[i + 1]},{bottoms[i]}"
+            yield f"{xs[i]},{bottoms[i]}"
+
+    return _batched(lines())
+
+
+GENERATORS: dict[int, Generator] = {
+    1: generate_day01,
+    2: generate_day02,
+    3: generate_day03,
+    4: generate_day04,
+    5: generate_day05,
+    6: generate_day06,
+    7: generate_day07,
+    8: generate_day08,
+    9: generate_day09,
+}
+
+BASE_SIZES: dict[int, int] = {
+    1: 4_400,
+    2: 32,
+    3: 200,
+    4: 135 * 135,
+    5: 200,
+    6: 1_000,
+    7: 141 * 141,
+    8: 1_000,
+    9: 496,
+}
+
+
+def scaled_size(day: int, scale: int) -> int:
+    return BASE_SIZES[day] * scale
+
+
+def write_input(day: int, scale: int, seed: int, path: Path) -> int:
+    """Write a generated input to ``path`` and return its logical size."""
+    n = scaled_size(day, scale)
+    rng = random.Random(f"{day}:{n}:{seed}")
+
+    with open(path, "wb") as file:
+        for chunk in GENERATORS[day](n, rng):
+            file.write(chunk)
+
+    return n
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m aoc.generate")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="file to write (default: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.output:
+        write_input(args.day, args.scale, args.seed, Path(args.output))
+        return
+
+    n = scaled_size(args.day, args.scale)
+    rng = random.Random(f"{args.day}:{n}:{args.seed}")
+    for chunk in GENERATORS[args.day](n, rng):
+        sys.stdout.buffer.write(chunk)
+
+
+if __name__ == "__main__":
+    main()
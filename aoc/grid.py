@@ -0,0 +1,161 @@
+"""
+Compact rectangular character grid shared by the grid days.
+
+Cells are single bytes in one ``bytearray``, row after row, with a border of
+``pad`` fill cells around the grid. A cell is addressed by its flat index,
+so neighbors are the index plus one of the fixed ``offsets`` and the border
+spares every bounds check. Loops over ``offsets`` and ``count_neighbors``
+read the buffer in place without allocating anything per cell.
+
+``view`` exposes the same buffer as a 2D uint8 NumPy array without copying;
+writes through either side are visible on the other.
+"""
+
+import copy
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Self
+
+from aoc.input import Buffer, iter_records
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class PaddedGrid:
+    def __init__(self, width: int, height: int, fill: str = ".", pad: int = 1) -> None:
+        if len(fill) != 1:
+            raise ValueError("Fill must be a single character")
+
+        self.width = width
+        self.height = height
+        self.pad = pad
+        self.stride = width + 2 * pad
+        self.fill = ord(fill)
+        self.cells = bytearray(fill.encode() * (self.stride * (height + 2 * pad)))
+
+        s = self.stride
+        self.offsets = (
+            -s - 1,  # Top-Left
+            -s,  # top
+            -s + 1,  # Top-Right
+            -1,  # Left
+            1,  # Right
+            s - 1,  # Bottom-Left
+            s,  # Bottom
+            s + 1,  # Bottom-Right
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[str | bytes], fill: str = ".", pad: int = 1) -> Self:
+        """
+        >>> grid = PaddedGrid.from_rows(["..@", "@@."])
+        >>> grid.width, grid.height, bytes(grid.cells)
+        (3, 2, b'.........@..@@.......')
+        """
+        encoded = [row.encode() if isinstance(row, str) else bytes(row) for row in rows]
+        width = len(encoded[0]) if encoded else 0
+        if any(len(row) != width for row in encoded):
+            raise ValueError("Grid rows must all have the same width")
+
+        grid = cls(width, len(encoded), fill, pad)
+        for y, row in enumerate(encoded):
+            start = grid.index(0, y)
+            grid.cells[start : start + width] = row
+        return grid
+
+    @classmethod
+    def decode(cls, data: Buffer, fill: str = ".", pad: int = 1) -> Self:
+        """
+        Decode the grid straight from the input bytes, skipping blank lines.
+
+        >>> print(PaddedGrid.decode(b"..@\\r\\n@@.\\r\\n\\n"))
+        ..@
+        @@.
+        """
+        return cls.from_rows(
+            (record for record in map(bytes.strip, iter_records(data)) if record), fill, pad
+        )
+
+    def copy(self) -> Self:
+        grid = copy.copy(self)
+        grid.cells = self.cells.copy()
+        return grid
+
+    def index(self, x: int, y: int) -> int:
+        """Flat index of a cell; coordinates are from the original grid."""
+        return (y + self.pad) * self.stride + x + self.pad
+
+    def coordinates(self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.stride)
+        return x - self.pad, y - self.pad
+
+    def get(self, x: int, y: int) -> str:
+        return chr(self.cells[self.index(x, y)])
+
+    def set(self, x: int, y: int, value: str) -> None:
+        self.cells[self.index(x, y)] = ord(value)
+
+    def row(self, y: int) -> memoryview:
+        """The cells of row ``y`` without the padding, as a view on the grid."""
+        start = self.index(0, y)
+        return memoryview(self.cells)[start : start + self.width]
+
+    def indices(self) -> Iterator[int]:
+        """Flat index of every cell inside the padding, row by row."""
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def count_neighbors(self, index: int, value: int) -> int:
+        """
+        >>> grid = PaddedGrid.from_rows(["@@.", "@@@"])
+        >>> grid.count_neighbors(grid.index(1, 0), ord("@"))
+        4
+        """
+        cells = self.cells
+        count = 0
+        for offset in self.offsets:
+            if cells[index + offset] == value:
+                count += 1
+        return count
+
+    def neighbor_counts(self, value: int) -> bytearray:
+        """
+        How many of the 8 neighbors of every cell hold ``value``, by flat index.
+
+        The cells are read as one little-endian integer with a 1 byte for
+        every ``value``; adding it shifted by one cell and by one row sums
+        every 3x3 window at once, and no byte can carry since a sum stays
+        below 10. Counts are only meaningful inside the padding.
+
+        >>> grid = PaddedGrid.from_rows(["@@.", "@@@"])
+        >>> list(grid.neighbor_counts(ord("@"))[grid.index(0, 0) :][:3])
+        [3, 4, 3]
+        """
+        if self.pad < 1:
+            raise ValueError("The grid needs at least one cell of padding")
+
+        table = bytearray(256)
+        table[value] = 1
+        size = len(self.cells)
+        mask = int.from_bytes(self.cells.translate(table), "little")
+
+        rows = mask + (mask << 8) + (mask >> 8)
+        shift = 8 * self.stride
+        window = rows + (rows << shift) + (rows >> shift) - mask
+        return bytearray(window.to_bytes(size + self.stride + 1, "little")[:size])
+
+    def view(self, padded: bool = False) -> "np.ndarray":
+        """Zero-copy 2D uint8 view of the grid, with its padding if ``padded``."""
+        import numpy as np
+
+        array = np.frombuffer(self.cells, dtype=np.uint8).reshape(-1, self.stride)
+        if padded or self.pad == 0:
+            return array
+        return array[self.pad : -self.pad, self.pad : -self.pad]
+
+    def __repr__(self) -> str:
+        return "\n".join(self.row(y).tobytes().decode() for y in range(self.height))
+
+    def __str__(self) -> str:
+        return self.__repr__()
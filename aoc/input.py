@@ -0,0 +1,269 @@
+"""
+Shared input layer for the day solvers.
+
+Files are memory-mapped and stdin is read in one bulk call, so a solver never
+holds the raw text and a list of stripped lines at the same time. Decoders
+work in record-aligned chunks and only materialise the typed result.
+``open_input`` unmaps the file again once the input is decoded, so the
+long-lived server and batch workers do not pile up one mapping per input.
+"""
+
+import io
+import mmap
+import os
+import re
+import sys
+from array import array
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import BinaryIO
+
+type Buffer = bytes | mmap.mmap
+type Source = str | os.PathLike[str] | bytes | None
+
+CHUNK_SIZE = 1 << 20
+
+_MOVE_SIGNS = bytes.maketrans(b"RL", b"+-")
+_DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+_SECTION_SEPARATOR = re.compile(rb"\r?\n[ \t]*\r?\n")
+
+
+def read_input(source: Source = None) -> Buffer:
+    """
+    Return the raw input for ``source``.
+
+    A path is memory-mapped, ``bytes`` are passed through untouched and
+    ``None`` reads stdin in one call. A mapping stays open until it is
+    garbage collected; use ``open_input`` to close it deterministically.
+    """
+    if source is None:
+        return read_stdin()
+
+    if isinstance(source, bytes):
+        return source
+
+    with open(source, "rb") as file:
+        try:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files cannot be mapped
+            return b""
+
+
+def read_stdin() -> bytes:
+    """All of stdin in one call."""
+    return sys.stdin.buffer.read()
+
+
+@contextmanager
+def open_input(source: Source = None) -> Iterator[Buffer]:
+    """
+    ``read_input`` for a ``with`` block that unmaps a mapped file on exit.
+    Nothing decoded from the buffer may keep a view into it.
+
+    >>> with open_input(b"R1\\n") as data:
+    ...     data
+    b'R1\\n'
+    """
+    data = read_input(source)
+    try:
+        yield data
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+
+def source_from_argv(index: int = 1) -> Source:
+    return sys.argv[index] if len(sys.argv) > index else None
+
+
+def iter_chunks(data: Buffer, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield consecutive slices of roughly ``chunk_size`` bytes that end on a
+    line boundary, so no record is split between two chunks.
+
+    >>> list(iter_chunks(b"R1\\nL22\\nR3\\n", chunk_size=4))
+    [b'R1\\nL22\\n', b'R3\\n']
+    """
+    start = 0
+    end = len(data)
+
+    while start < end:
+        stop = start + chunk_size
+        if stop >= end:
+            yield data[start:end]
+            return
+
+        newline = data.find(b"\n", stop - 1)
+        stop = end if newline == -1 else newline + 1
+        yield data[start:stop]
+        start = stop
+
+
+def stream_chunks(source: Source = None, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Read ``source`` in blocks of ``chunk_size`` bytes and yield them cut at
+    line boundaries, carrying a partial last line over to the next block.
+    Unlike ``read_input`` this never holds more than about one block, so it
+    suits logs larger than memory and endless stdin pipes.
+
+    >>> list(stream_chunks(b"R1\\nL22\\nR3", chunk_size=4))
+    [b'R1\\n', b'L22\\n', b'R3']
+    """
+    if source is None:
+        yield from _stream_file(sys.stdin.buffer, chunk_size)
+    elif isinstance(source, bytes):
+        yield from _stream_file(io.BytesIO(source), chunk_size)
+    else:
+        with open(source, "rb") as file:
+            yield from _stream_file(file, chunk_size)
+
+
+def _stream_file(file: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    rest = b""
+    while block := file.read(chunk_size):
+        cut = block.rfind(b"\n") + 1
+        if cut == 0:
+            rest += block
+            continue
+        yield rest + block[:cut]
+        rest = block[cut:]
+
+    if rest:
+        yield rest
+
+
+def iter_records(data: Buffer) -> Iterator[bytes]:
+    """
+    Lazily yield every line of ``data`` without its line terminator.
+
+    >>> list(iter_records(b"ab\\r\\n\\ncd"))
+    [b'ab', b'', b'cd']
+    """
+    for chunk in iter_chunks(data):
+        yield from chunk.splitlines()
+
+
+def iter_lines(data: Buffer) -> Iterator[str]:
+    """
+    Lazily yield every line of ``data`` decoded and stripped, the same values
+    the old ``[line.strip() for line in readlines()]`` produced.
+    """
+    for record in iter_records(data):
+        yield record.decode().strip()
+
+
+def split_sections(data: Buffer) -> list[bytes]:
+    """
+    >>> split_sections(b"3-5\\n10-14\\n\\n1\\n5\\n")
+    [b'3-5\\n10-14', b'1\\n5\\n']
+    """
+    return _SECTION_SEPARATOR.split(data)
+
+
+def decode_moves(data: Buffer) -> array[int]:
+    """
+    Decode ``R12``/``L7`` moves into signed amounts, right turns positive.
+
+    >>> decode_moves(b"R12\\nL7\\nR0\\n").tolist()
+    [12, -7, 0]
+    """
+    moves = array("q")
+    for chunk in iter_chunks(data):
+        try:
+            moves.extend(map(int, chunk.translate(_MOVE_SIGNS).split()))
+        except ValueError as e:
+            raise ValueError(f"Invalid move in input: {e}") from e
+    return moves
+
+
+def decode_ints(data: Buffer) -> list[int]:
+    """
+    >>> decode_ints(b"1\\n5\\n 8\\n")
+    [1, 5, 8]
+    """
+    values: list[int] = []
+    for chunk in iter_chunks(data):
+        values.extend(map(int, chunk.split()))
+    return values
+
+
+def decode_ranges(data: Buffer) -> list[tuple[int, int]]:
+    """
+    Decode ``a-b`` ranges separated by commas or whitespace.
+
+    >>> decode_ranges(b"11-22,95-115\\n")
+    [(11, 22), (95, 115)]
+    """
+    ranges: list[tuple[int, int]] = []
+    for chunk in iter_chunks(data):
+        for token in chunk.replace(b",", b" ").split():
+            lower_bound, separator, upper_bound = token.partition(b"-")
+            if not separator or not lower_bound or not upper_bound:
+                raise ValueError(f"Invalid range format: {token.decode()}")
+            ranges.append((int(lower_bound), int(upper_bound)))
+    return ranges
+
+
+def decode_int_tuples(data: Buffer) -> list[tuple[int, ...]]:
+    """
+    Decode one comma-separated int tuple per line. Every line must have the
+    same width as the first one.
+
+    >>> decode_int_tuples(b"162,817,812\\n57,618,57\\n")
+    [(162, 817, 812), (57, 618, 57)]
+    >>> decode_int_tuples(b"1,2,3\\n4,5\\n6\\n")
+    Traceback (most recent call last):
+    ...
+    ValueError: Expected 3 values per line
+    """
+    first_line = next((r for r in iter_records(data) if r.strip()), b"")
+    width = first_line.count(b",") + 1
+
+    tuples: list[tuple[int, ...]] = []
+    for chunk in iter_chunks(data):
+        lines = [record for record in chunk.splitlines() if record.strip()]
+        values = list(map(int, chunk.replace(b",", b" ").split()))
+        # the total alone would let a short line borrow from the next one
+        if len(values) != width * len(lines) or any(
+            line.count(b",") != width - 1 for line in lines
+        ):
+            raise ValueError(f"Expected {width} values per line")
+
+        iterator = iter(values)
+        tuples.extend(zip(*[iterator] * width))
+    return tuples
+
+
+def decode_digits(data: Buffer) -> list[bytes]:
+    """
+    Decode lines of decimal digits. Every item of a returned row is the digit
+    value, so a row behaves like a compact ``list[int]``.
+
+    >>> [list(row) for row in decode_digits(b"987\\n811\\n")]
+    [[9, 8, 7], [8, 1, 1]]
+    """
+    rows: list[bytes] = []
+    for record in iter_records(data):
+        record = record.strip()
+        if not record:
+            continue
+        if not record.isdigit():
+            raise ValueError(f"Invalid digit string: {record.decode()}")
+        rows.append(record.translate(_DIGIT_VALUES))
+    return rows
+
+
+def decode_grid(data: Buffer) -> list[str]:
+    """
+    Decode a rectangular character grid, one string per row.
+
+    >>> decode_grid(b"..@\\n@@.\\n")
+    ['..@', '@@.']
+    """
+    rows = [line for line in iter_lines(data) if line]
+
+    if rows and any(len(row) != len(rows[0]) for row in rows):
+        raise ValueError("Grid rows must all have the same width")
+
+    return rows
@@ -0,0 +1,108 @@
+"""
+Opt-in spans and counters for solver hot paths.
+
+Solvers wrap their stages in ``with span("sort distances"):`` and report
+counters with ``count("junk02.unions", unions)``. Counters should be summed
+in a local variable inside the loop and reported once afterwards, so the
+loop itself never calls into this module.
+
+Everything is a no-op until ``enable()`` is called. When enabled, span
+self-times are aggregated per stack and can be written in the collapsed
+format read by flamegraph.pl and speedscope.
+"""
+
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager
+
+_NULL_SPAN = nullcontext()
+
+_enabled = False
+_stack: list[str] = []
+_child_time: list[float] = []
+_self_times: defaultdict[str, float] = defaultdict(float)
+_span_totals: defaultdict[str, float] = defaultdict(float)
+_span_calls: defaultdict[str, int] = defaultdict(int)
+_counters: defaultdict[str, int] = defaultdict(int)
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    _stack.clear()
+    _child_time.clear()
+    _self_times.clear()
+    _span_totals.clear()
+    _span_calls.clear()
+    _counters.clear()
+
+
+def span(name: str) -> ContextManager[None]:
+    if not _enabled:
+        return _NULL_SPAN
+    return _timed_span(name)
+
+
+@contextmanager
+def _timed_span(name: str) -> Iterator[None]:
+    _stack.append(name)
+    _child_time.append(0.0)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        children = _child_time.pop()
+        _self_times[";".join(_stack)] += elapsed - children
+        _stack.pop()
+
+        _span_totals[name] += elapsed
+        _span_calls[name] += 1
+        if _child_time:
+            _child_time[-1] += elapsed
+
+
+def count(name: str, value: int = 1) -> None:
+    if _enabled:
+        _counters[name] += value
+
+
+def folded_stacks() -> list[str]:
+    """Self-time per stack in microseconds, one ``a;b;c 1234`` line each."""
+    return [
+        f"{stack} {round(seconds * 1_000_000)}"
+        for stack, seconds in sorted(_self_times.items())
+    ]
+
+
+def write_folded(path: str) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        file.writelines(f"{line}\n" for line in folded_stacks())
+
+
+def summary() -> str:
+    lines = [f"{'span':<32} {'calls':>8} {'total ms':>12}"]
+    for name, total in sorted(_span_totals.items(), key=lambda item: -item[1]):
+        lines.append(f"{name:<32} {_span_calls[name]:>8} {total * 1000:>12.3f}")
+
+    if _counters:
+        lines.append("")
+        lines.append(f"{'counter':<32} {'value':>21}")
+        for name, value in sorted(_counters.items()):
+            lines.append(f"{name:<32} {value:>21}")
+
+    return "\n".join(lines)
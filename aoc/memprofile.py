@@ -0,0 +1,84 @@
+"""
+Peak memory and top allocation sites of a call, using tracemalloc.
+
+tracemalloc only reports the peak size, not what was alive at the peak, so
+a background thread polls the traced size and snapshots the heap whenever
+it grows by more than ``GROWTH`` over the last snapshot. The largest
+snapshot is the one reported, which keeps short-lived intermediates such
+as day08's distance dict in the picture.
+"""
+
+import threading
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+POLL_INTERVAL = 0.001
+GROWTH = 1.1
+
+
+class _PeakSampler(threading.Thread):
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.stopped = threading.Event()
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.snapshot_size = 0
+
+    def sample(self) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.snapshot_size * GROWTH:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current
+
+    def run(self) -> None:
+        while not self.stopped.wait(POLL_INTERVAL):
+            self.sample()
+
+
+def profile_memory[R](func: Callable[[], R], top: int = 10) -> tuple[R, dict[str, Any]]:
+    """Call ``func`` under tracemalloc and return its result and a report."""
+    tracemalloc.start()
+    sampler = _PeakSampler()
+    sampler.start()
+    try:
+        result = func()
+        sampler.sample()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        sampler.stopped.set()
+        sampler.join()
+        snapshot = sampler.snapshot
+        tracemalloc.stop()
+
+    sites = []
+    if snapshot is not None:
+        # leave out the sampler's own bookkeeping
+        snapshot = snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, filename)
+                for filename in (tracemalloc.__file__, threading.__file__, __file__)
+            ]
+        )
+        for statistic in snapshot.statistics("lineno")[:top]:
+            frame = statistic.traceback[0]
+            sites.append(
+                {
+                    "site": f"{frame.filename}:{frame.lineno}",
+                    "size_kib": statistic.size / 1024,
+                    "count": statistic.count,
+                }
+            )
+
+    return result, {"peak_kib": peak / 1024, "top": sites}
+
+
+def format_report(report: dict[str, Any]) -> str:
+    lines = [
+        f"traced peak: {report['peak_kib'] / 1024:.1f} MiB",
+        "top allocation sites near the peak:",
+    ]
+    for site in report["top"]:
+        lines.append(
+            f"  {site['size_kib']:>10.1f} KiB {site['count']:>9} blocks  {site['site']}"
+        )
+    return "\n".join(lines)
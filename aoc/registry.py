@@ -0,0 +1,302 @@
+"""
+Table of every day/part solver.
+
+Entries only name their modules, so looking a solver up never imports it.
+Every engine module exposes ``parse_input(source)`` and ``solve(data, **params)``
+(or the functions named on its ``Engine``).
+
+A solver's own module is its reference engine. Alternative engines declare
+the input size in bytes from which automatic selection prefers them; the
+largest threshold not above the input size wins, later entries win ties and
+``min_size=None`` engines only run when asked for by name.
+
+Input on stdin is read in full before an engine is picked, because its size
+is unknown until then, unless the engine is named explicitly and declared
+``streaming``: its ``parse_input(None)`` then reads stdin itself.
+"""
+
+import importlib
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# importing numpy takes about 100 ms, which the pure Python solvers beat on
+# inputs below roughly a megabyte
+NUMPY_MIN_SIZE = 1 << 20
+# vectorized engines hold the whole decoded input, several times the file size
+STREAM_MIN_SIZE = 1 << 30
+
+
+@dataclass(frozen=True)
+class Engine:
+    name: str
+    module: str
+    min_size: int | None = 0
+    requires: tuple[str, ...] = ()
+    parse: str = "parse_input"
+    solve: str = "solve"
+    # reads its input incrementally and can be handed stdin unread
+    streaming: bool = False
+
+    def is_available(self) -> bool:
+        return all(find_spec(requirement) is not None for requirement in self.requires)
+
+    def load(self) -> tuple[Callable[..., Any], Callable[..., Any]]:
+        module = importlib.import_module(self.module)
+        return getattr(module, self.parse), getattr(module, self.solve)
+
+
+@dataclass(frozen=True)
+class Solver:
+    day: int
+    part: int
+    module: str
+    input: str
+    params: dict[str, Any] = field(default_factory=dict, hash=False)
+    sample: str | None = None
+    sample_params: dict[str, Any] = field(default_factory=dict, hash=False)
+    engines: tuple[Engine, ...] = ()
+    # parsing is expensive enough to be worth caching
+    cache_parse: bool = False
+
+    @property
+    def key(self) -> str:
+        return f"{self.day:02d}.{self.part}"
+
+    @property
+    def input_path(self) -> Path:
+        return ROOT / self.input
+
+    @property
+    def sample_path(self) -> Path | None:
+        return ROOT / self.sample if self.sample else None
+
+    @property
+    def all_engines(self) -> tuple[Engine, ...]:
+        return (Engine("reference", self.module), *self.engines)
+
+    def engine(self, name: str) -> Engine:
+        for engine in self.all_engines:
+            if engine.name == name:
+                if not engine.is_available():
+                    raise ValueError(
+                        f"Engine {name} of {self.key} requires {', '.join(engine.requires)}"
+                    )
+                return engine
+
+        names = ", ".join(engine.name for engine in self.all_engines)
+        raise ValueError(f"Unknown engine {name} for {self.key}, choose from: {names}")
+
+    def select_engine(self, size: int) -> Engine:
+        """Pick the engine for an input of ``size`` bytes."""
+        selected = self.all_engines[0]
+        for engine in self.all_engines[1:]:
+            if (
+                engine.min_size is not None
+                and engine.min_size <= size
+                and engine.min_size >= (selected.min_size or 0)
+                and engine.is_available()
+            ):
+                selected = engine
+        return selected
+
+
+SOLVERS: dict[tuple[int, int], Solver] = {
+    (solver.day, solver.part): solver
+    for solver in (
+        Solver(
+            1,
+            1,
+            "day01.dial_01",
+            "day01/input_long.txt",
+            sample="day01/input_simple.txt",
+            engines=(
+                Engine(
+                    "numpy",
+                    "day01.dial_numpy",
+                    min_size=NUMPY_MIN_SIZE,
+                    requires=("numpy",),
+                    solve="solve_zero_positions",
+                ),
+                Engine(
+                    "stream",
+                    "day01.dial_stream",
+                    min_size=STREAM_MIN_SIZE,
+                    solve="solve_zero_positions",
+                    streaming=True,
+                ),
+                Engine(
+                    "parallel", "day01.dial_parallel", min_size=None, solve="solve_zero_positions"
+                ),
+                Engine("index", "day01.dial_index", min_size=None, solve="solve_zero_positions"),
+            ),
+        ),
+        Solver(
+            1,
+            2,
+            "day01.dial_02",
+            "day01/input_long.txt",
+            sample="day01/input_simple.txt",
+            engines=(
+                Engine(
+                    "numpy",
+                    "day01.dial_numpy",
+                    min_size=NUMPY_MIN_SIZE,
+                    requires=("numpy",),
+                    solve="solve_rotations",
+                ),
+                Engine(
+                    "stream",
+                    "day01.dial_stream",
+                    min_size=STREAM_MIN_SIZE,
+                    solve="solve_rotations",
+                    streaming=True,
+                ),
+                Engine(
+                    "parallel", "day01.dial_parallel", min_size=None, solve="solve_rotations"
+                ),
+                Engine("index", "day01.dial_index", min_size=None, solve="solve_rotations"),
+            ),
+        ),
+        Solver(
+            2,
+            1,
+            "day02.part01",
+            "day02/input_long.txt",
+            sample="day02/input_sample.txt",
+            engines=(
+                Engine("closed_form", "day02.repeated", solve="solve_doubled"),
+                Engine("index", "day02.id_index", min_size=None, solve="solve_doubled"),
+                Engine("parallel", "day02.brute_force", min_size=None, solve="solve_doubled"),
+            ),
+        ),
+        Solver(
+            2,
+            2,
+            "day02.part02",
+            "day02/input_long.txt",
+            sample="day02/input_sample.txt",
+            engines=(
+                Engine("closed_form", "day02.repeated", solve="solve_repeated"),
+                Engine("index", "day02.id_index", min_size=None, solve="solve_repeated"),
+                Engine("parallel", "day02.brute_force", min_size=None, solve="solve_repeated"),
+            ),
+        ),
+        Solver(
+            3,
+            1,
+            "day03.jolt01",
+            "day03/input_large.txt",
+            sample="day03/input_example.txt",
+            engines=(
+                Engine(
+                    "numpy",
+                    "day03.jolt_numpy",
+                    min_size=NUMPY_MIN_SIZE,
+                    requires=("numpy",),
+                    solve="solve_two",
+                ),
+                Engine("rmq", "day03.bank_index", min_size=None, solve="solve_two"),
+            ),
+        ),
+        Solver(
+            3,
+            2,
+            "day03.jolt02",
+            "day03/input_large.txt",
+            sample="day03/input_example.txt",
+            engines=(
+                Engine(
+                    "numpy",
+                    "day03.jolt_numpy",
+                    min_size=NUMPY_MIN_SIZE,
+                    requires=("numpy",),
+                    solve="solve_twelve",
+                ),
+                Engine("rmq", "day03.bank_index", min_size=None, solve="solve_twelve"),
+            ),
+        ),
+        Solver(
+            4,
+            1,
+            "day04.rolls01",
+            "day04/input_large.txt",
+            sample="day04/input_sample.txt",
+            engines=(
+                Engine("numpy", "day04.rolls_numpy", min_size=NUMPY_MIN_SIZE, requires=("numpy",)),
+                Engine(
+                    "tiled",
+                    "day04.rolls_tiled",
+                    min_size=None,
+                    requires=("numpy",),
+                    solve="solve_accessible",
+                ),
+            ),
+        ),
+        Solver(
+            4,
+            2,
+            "day04.rolls02",
+            "day04/input_large.txt",
+            sample="day04/input_sample.txt",
+            engines=(
+                Engine("peel", "day04.rolls_peel"),
+                Engine("waves", "day04.rolls_waves", min_size=NUMPY_MIN_SIZE, requires=("numpy",)),
+                Engine(
+                    "tiled",
+                    "day04.rolls_tiled",
+                    min_size=None,
+                    requires=("numpy",),
+                    solve="solve_removable",
+                ),
+            ),
+        ),
+        Solver(5, 1, "day05.ranges01", "day05/input_large.txt", sample="day05/input_sample.txt"),
+        Solver(5, 2, "day05.ranges02", "day05/input_large.txt", sample="day05/input_sample.txt"),
+        Solver(6, 1, "day06.calc01", "day06/input_large.txt", sample="day06/input_simple.txt"),
+        Solver(6, 2, "day06.calc02", "day06/input_large.txt", sample="day06/input_simple.txt"),
+        Solver(7, 1, "day07.beam01", "day07/input_large.txt", sample="day07/input_simple.txt"),
+        Solver(7, 2, "day07.beam02", "day07/input_large.txt", sample="day07/input_simple.txt"),
+        Solver(
+            8,
+            1,
+            "day08.junk01",
+            "day08/input_large.txt",
+            params={"iterations": 1000},
+            sample="day08/input_simple.txt",
+            sample_params={"iterations": 10},
+        ),
+        Solver(8, 2, "day08.junk02", "day08/input_large.txt", sample="day08/input_simple.txt"),
+        Solver(
+            9,
+            1,
+            "day09.rect01",
+            "day09/input_large.txt",
+            sample="day09/input_simple.txt",
+            cache_parse=True,
+        ),
+        Solver(
+            9,
+            2,
+            "day09.rect02_naive",
+            "day09/input_large.txt",
+            sample="day09/input_simple.txt",
+            cache_parse=True,
+            engines=(
+                Engine("parallel", "day09.rect02_naive_multiprocess", min_size=None),
+                Engine("optimized", "day09.rect02_geminy"),
+            ),
+        ),
+    )
+}
+
+
+def get_solver(day: int, part: int) -> Solver:
+    try:
+        return SOLVERS[(day, part)]
+    except KeyError as e:
+        raise ValueError(f"No solver for day {day} part {part}") from e
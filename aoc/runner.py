@@ -0,0 +1,107 @@
+"""Run a single solver and time each stage."""
+
+import os
+import time
+from typing import Any, NamedTuple
+
+from aoc import instrument
+from aoc.cache import MISSING, Cache, code_version, hash_bytes, use_cache
+from aoc.input import Source, open_input, read_stdin
+from aoc.registry import Engine, Solver
+
+
+class RunResult(NamedTuple):
+    answer: Any
+    engine: str
+    import_time: float
+    parse_time: float
+    solve_time: float
+
+
+def input_size(source: Source) -> int:
+    if isinstance(source, bytes):
+        return len(source)
+    return os.path.getsize(source)  # type: ignore[arg-type]
+
+
+def resolve_engine(solver: Solver, source: Source, engine: str | None) -> Engine:
+    if engine is not None:
+        return solver.engine(engine)
+    return solver.select_engine(input_size(source))
+
+
+def run_solver(
+    solver: Solver,
+    source: Source = None,
+    params: dict[str, Any] | None = None,
+    engine: str | None = None,
+    cache: Cache | None = None,
+) -> RunResult:
+    """
+    Import the engine module (a no-op after the first call), parse ``source``
+    and solve it. ``params`` override the solver's defaults and ``engine``
+    overrides the size-based engine selection.
+
+    With a ``cache`` the answer is looked up by input content, solver, params
+    and the code of the selected engine first, and ``@artifact``
+    intermediates are cached while solving. A cached answer is reported with
+    the engine name ``"cache"``. A run with an explicit ``engine`` always
+    solves, so the engine it names is the one that runs.
+
+    Stdin is handed unread to a ``streaming`` engine named by ``engine``, and
+    such a run skips the cache, which would need the whole input first.
+    """
+    if source is None and engine is not None and solver.engine(engine).streaming:
+        cache = None
+    elif source is None:
+        # stdin has no size until it is read
+        source = read_stdin()
+
+    params = {**solver.params, **(params or {})}
+    selected = resolve_engine(solver, source, engine)
+
+    if cache is not None:
+        with open_input(source) as data:
+            input_hash = hash_bytes(data)
+        version = code_version(selected.module)
+        answer_key = ("answer", solver.key, version, input_hash, sorted(params.items()))
+        answer = cache.get(answer_key) if engine is None else MISSING
+        if answer is not MISSING:
+            return RunResult(answer, "cache", 0.0, 0.0, 0.0)
+
+    with instrument.span(solver.key):
+        start = time.perf_counter()
+        parse_input, solve = selected.load()
+        loaded = time.perf_counter()
+        with instrument.span("parse"):
+            if cache is not None and solver.cache_parse:
+                parse_key = ("parse", selected.module, selected.parse, version, input_hash)
+                data = cache.get_or_compute(parse_key, lambda: parse_input(source))
+            else:
+                data = parse_input(source)
+        parsed = time.perf_counter()
+        with instrument.span("solve"), use_cache(cache):
+            answer = solve(data, **params)
+        solved = time.perf_counter()
+
+    if cache is not None:
+        cache.put(answer_key, answer)
+
+    return RunResult(answer, selected.name, loaded - start, parsed - loaded, solved - parsed)
+
+
+def check_engines(
+    solver: Solver, source: Source, params: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """
+    Solve ``source`` with every available engine and return the answers by
+    engine name. Meant for small inputs, the reference engine is the slowest.
+    """
+    if source is None:
+        source = read_stdin()
+
+    return {
+        engine.name: run_solver(solver, source, params, engine.name).answer
+        for engine in solver.all_engines
+        if engine.is_available()
+    }
@@ -0,0 +1,165 @@
+"""
+Long-running solver server on a Unix domain socket.
+
+    python -m aoc serve --workers 8
+
+Every worker process imports all available engine modules once at startup,
+so a request pays only for parsing and solving. Each connection is handled
+on its own thread and its solve is handed to the worker pool, so requests
+are served concurrently up to the pool size. See ``aoc.client`` for the
+wire format and the command line client.
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from aoc.cache import Cache
+from aoc.client import default_socket_path
+from aoc.registry import SOLVERS, get_solver
+from aoc.runner import run_solver
+
+_worker_cache: Cache | None = None
+
+
+def _init_worker(use_cache: bool) -> None:
+    global _worker_cache
+
+    # the server process handles Ctrl+C and shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    for solver in SOLVERS.values():
+        for engine in solver.all_engines:
+            if engine.is_available():
+                engine.load()
+
+    _worker_cache = Cache() if use_cache else None
+
+
+def _solve(
+    day: int,
+    part: int,
+    source: str | bytes,
+    params: dict[str, Any],
+    engine: str | None,
+) -> dict[str, Any]:
+    try:
+        solver = get_solver(day, part)
+        result = run_solver(solver, source, params, engine, _worker_cache)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+    return {"ok": True, "answer": result.answer, "engine": result.engine}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "SolverServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            # a bare connect, e.g. remove_stale_socket probing for a live server
+            return
+
+        try:
+            header = json.loads(line)
+            if "size" in header:
+                source = self.rfile.read(header["size"])
+            else:
+                source = header["path"]
+            response = self.server.solve(
+                header["day"],
+                header["part"],
+                source,
+                header.get("params") or {},
+                header.get("engine"),
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            response = {"ok": False, "error": f"bad request: {e}"}
+
+        try:
+            self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+        except BrokenPipeError:
+            pass  # the client gave up waiting
+
+
+class SolverServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(
+        self, socket_path: str, workers: int | None = None, use_cache: bool = True
+    ) -> None:
+        self.socket_path = socket_path
+        self.workers = workers
+        self.use_cache = use_cache
+        self.pool = self._new_pool()
+        self._pool_lock = threading.Lock()
+        super().__init__(socket_path, _RequestHandler)
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker, initargs=(self.use_cache,)
+        )
+
+    def _replace_pool(self, broken: ProcessPoolExecutor) -> None:
+        """Swap in a fresh pool, unless another request already replaced ``broken``."""
+        with self._pool_lock:
+            if self.pool is broken:
+                self.pool = self._new_pool()
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def solve(self, *args: Any) -> dict[str, Any]:
+        """
+        Run ``_solve`` in the pool. A worker dying breaks the whole pool and
+        fails every request in it, so each affected request is retried once
+        on a fresh pool; only a request that breaks that one as well fails.
+        """
+        for _ in range(2):
+            pool = self.pool
+            try:
+                return pool.submit(_solve, *args).result()
+            except BrokenProcessPool:
+                self._replace_pool(pool)
+        return {"ok": False, "error": "worker process died"}
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.shutdown(cancel_futures=True)
+        os.unlink(self.socket_path)
+
+
+def remove_stale_socket(socket_path: str) -> None:
+    """Remove a socket file left behind by a dead server, refuse a live one."""
+    if not os.path.exists(socket_path):
+        return
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except ConnectionRefusedError:
+            os.unlink(socket_path)
+            return
+
+    raise ValueError(f"a server is already listening on {socket_path}")
+
+
+def serve(
+    socket_path: str | None = None, workers: int | None = None, use_cache: bool = True
+) -> None:
+    socket_path = socket_path or default_socket_path()
+    remove_stale_socket(socket_path)
+    # let `kill` shut down as cleanly as Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    with SolverServer(socket_path, workers, use_cache) as server:
+        print(f"serving on {socket_path}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,85 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from aoc.batch import expand_inputs, run_batch
+from aoc.input import open_input
+from aoc.registry import Solver, get_solver
+from aoc.runner import run_solver
+
+# this module doubles as the solver below, which misbehaves on request
+misbehaving = Solver(0, 0, "aoc.test_batch", "unused")
+
+
+def parse_input(source):
+    with open_input(source) as data:
+        return bytes(data).strip()
+
+
+def solve(data):
+    if data == b"crash":
+        os._exit(1)
+    if data == b"hang":
+        time.sleep(30)
+    return len(data)
+
+
+class TestRunBatch(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def write(self, name, content):
+        path = self.directory / name
+        path.write_text(content)
+        return str(path)
+
+    def test_matches_single_runs(self):
+        solver = get_solver(3, 2)
+        sample = solver.sample_path.read_text()
+        paths = [self.write(f"{i}.txt", sample * i) for i in range(1, 5)]
+        results = list(run_batch(solver, paths, workers=2, use_cache=False))
+        self.assertEqual(sorted(result["input"] for result in results), paths)
+        for result in results:
+            with self.subTest(input=result["input"]):
+                self.assertTrue(result["ok"])
+                self.assertEqual(result["answer"], run_solver(solver, result["input"]).answer)
+
+    def test_only_the_crashing_input_fails(self):
+        paths = [self.write(f"{i}.txt", "ok" * i) for i in range(1, 6)]
+        crashing = self.write("crash.txt", "crash")
+        results = {
+            result["input"]: result
+            for result in run_batch(misbehaving, [*paths, crashing], workers=2, use_cache=False)
+        }
+        self.assertFalse(results[crashing]["ok"])
+        self.assertEqual(results[crashing]["error"], "worker process died")
+        for i, path in enumerate(paths, 1):
+            self.assertEqual(results[path]["answer"], 2 * i)
+
+    def test_timeout(self):
+        quick = self.write("quick.txt", "ok")
+        hanging = self.write("hang.txt", "hang")
+        results = {
+            result["input"]: result
+            for result in run_batch(
+                misbehaving, [quick, hanging], workers=2, timeout=0.5, use_cache=False
+            )
+        }
+        self.assertTrue(results[quick]["ok"])
+        self.assertFalse(results[hanging]["ok"])
+        self.assertIn("timed out", results[hanging]["error"])
+
+    def test_expand_inputs(self):
+        first = self.write("a.txt", "")
+        second = self.write("b.txt", "")
+        self.write("c.log", "")
+        self.assertEqual(expand_inputs([str(self.directory / "*.txt")]), [first, second])
+        self.assertEqual(len(expand_inputs([str(self.directory), first])), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from aoc.cache import MISSING, Cache, artifact, code_version, use_cache
+from aoc.registry import get_solver
+from aoc.runner import run_solver
+
+calls: list[list[int]] = []
+
+
+@artifact("test.sorted")
+def sorted_copy(values):
+    calls.append(values)
+    return sorted(values)
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.cache = Cache(self.directory)
+        calls.clear()
+
+    def entries(self):
+        return len(list(self.directory.glob("*.pickle")))
+
+    def test_get_and_put(self):
+        self.assertIs(self.cache.get(("key",)), MISSING)
+        self.cache.put(("key",), [1, 2])
+        self.assertEqual(self.cache.get(("key",)), [1, 2])
+        self.assertIs(self.cache.get(("other",)), MISSING)
+
+    def test_evicts_least_recently_used(self):
+        cache = Cache(self.directory, max_bytes=1000)
+        for i in range(10):
+            cache.put((i,), bytes(300))
+        self.assertLessEqual(self.entries(), 3)
+        self.assertIsNot(cache.get((9,)), MISSING)
+        self.assertIs(cache.get((0,)), MISSING)
+
+    def test_artifact_computes_once(self):
+        self.assertEqual(sorted_copy([3, 1, 2]), [1, 2, 3])
+        with use_cache(self.cache):
+            first = sorted_copy([3, 1, 2])
+            first.append(4)
+            self.assertEqual(sorted_copy([3, 1, 2]), [1, 2, 3])
+        self.assertEqual(len(calls), 2)
+
+    def test_code_version_follows_the_module(self):
+        self.assertEqual(code_version("day05.ranges01"), code_version("day05.ranges01"))
+        self.assertNotEqual(code_version("day05.ranges01"), code_version("day05.ranges02"))
+        self.assertEqual(code_version("no.such.module"), code_version("no.such.other"))
+
+    def test_parts_share_artifacts(self):
+        """Part 2 of days 5 and 8 reuses what part 1 cached."""
+        for day in (5, 8):
+            with self.subTest(day=day):
+                part1, part2 = get_solver(day, 1), get_solver(day, 2)
+                run_solver(part1, part1.sample_path, part1.sample_params, cache=self.cache)
+                entries = self.entries()
+                run_solver(part2, part2.sample_path, cache=self.cache)
+                # only the answer of part 2 is new
+                self.assertEqual(self.entries(), entries + 1)
+
+    def test_cached_answer_unless_engine_forced(self):
+        solver = get_solver(3, 2)
+        first = run_solver(solver, solver.sample_path, cache=self.cache)
+        cached = run_solver(solver, solver.sample_path, cache=self.cache)
+        forced = run_solver(solver, solver.sample_path, engine="rmq", cache=self.cache)
+        self.assertEqual(cached.engine, "cache")
+        self.assertEqual(forced.engine, "rmq")
+        self.assertEqual({first.answer, cached.answer, forced.answer}, {first.answer})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import shlex
+import unittest
+
+import aoc.__main__
+import aoc.client
+
+
+def documented_invocations(module, prog):
+    """Arguments of every ``prog`` example in the docstring of ``module``."""
+    for line in module.__doc__.splitlines():
+        command, _, _ = line.strip().partition(" < ")
+        if command.startswith(prog + " "):
+            yield shlex.split(command.removeprefix(prog))
+
+
+class TestRunArguments(unittest.TestCase):
+    def test_documented_invocations_parse(self):
+        invocations = list(documented_invocations(aoc.__main__, "python -m aoc"))
+        self.assertGreater(len(invocations), 5)
+        for argv in invocations:
+            with self.subTest(argv=argv):
+                args = aoc.__main__.parse_args(argv)
+                self.assertEqual(args.command, argv[0])
+
+    def test_input_after_options(self):
+        args = aoc.__main__.parse_args(["run", "8", "1", "--iterations", "1000", "input.txt"])
+        self.assertEqual((args.day, args.part), (8, 1))
+        self.assertEqual(args.iterations, 1000)
+        self.assertEqual(args.input, "input.txt")
+
+    def test_input_before_options(self):
+        args = aoc.__main__.parse_args(["run", "9", "2", "input.txt", "--engine", "optimized"])
+        self.assertEqual(args.input, "input.txt")
+        self.assertEqual(args.engine, "optimized")
+
+    def test_stdin_without_input(self):
+        args = aoc.__main__.parse_args(["run", "1", "2", "--timing"])
+        self.assertIsNone(args.input)
+        self.assertTrue(args.timing)
+
+    def test_batch_patterns_around_options(self):
+        args = aoc.__main__.parse_args(["batch", "3", "2", "a/*.txt", "--workers", "8", "b"])
+        self.assertEqual(args.inputs, ["a/*.txt", "b"])
+        self.assertEqual(args.workers, 8)
+
+
+class TestClientArguments(unittest.TestCase):
+    def test_documented_invocations_parse(self):
+        invocations = list(documented_invocations(aoc.client, "python -m aoc.client"))
+        self.assertEqual(len(invocations), 3)
+        for argv in invocations:
+            with self.subTest(argv=argv):
+                args = aoc.client.parse_args(argv)
+                self.assertEqual(args.day, int(argv[0]))
+
+    def test_input_after_options(self):
+        args = aoc.client.parse_args(["8", "1", "--iterations", "1000", "input.txt"])
+        self.assertEqual(args.iterations, 1000)
+        self.assertEqual(args.input, "input.txt")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import random
+import unittest
+from importlib.util import find_spec
+
+from aoc.grid import PaddedGrid
+
+
+def random_rows(rng, width, height):
+    return ["".join(rng.choice(".@") for _ in range(width)) for _ in range(height)]
+
+
+class TestPaddedGrid(unittest.TestCase):
+    def test_cells_round_trip(self):
+        rows = ["..@", "@@.", "@.@"]
+        for pad in (1, 2, 3):
+            with self.subTest(pad=pad):
+                grid = PaddedGrid.from_rows(rows, pad=pad)
+                self.assertEqual(str(grid), "\n".join(rows))
+                self.assertEqual(grid.get(2, 0), "@")
+                self.assertEqual(grid.coordinates(grid.index(1, 2)), (1, 2))
+                self.assertEqual(sum(1 for _ in grid.indices()), 9)
+
+    def test_decode_matches_from_rows(self):
+        decoded = PaddedGrid.decode(b"..@\r\n@@.\r\n\n")
+        self.assertEqual(decoded.cells, PaddedGrid.from_rows(["..@", "@@."]).cells)
+
+    def test_rejects_ragged_rows(self):
+        with self.assertRaises(ValueError):
+            PaddedGrid.from_rows(["..@", "@@"])
+
+    def test_neighbor_counts_match_count_neighbors(self):
+        rng = random.Random(21)
+        for _ in range(30):
+            pad = rng.randrange(1, 3)
+            grid = PaddedGrid.from_rows(
+                random_rows(rng, rng.randrange(1, 15), rng.randrange(1, 15)), pad=pad
+            )
+            counts = grid.neighbor_counts(ord("@"))
+            with self.subTest(grid=str(grid), pad=pad):
+                self.assertEqual(
+                    [counts[index] for index in grid.indices()],
+                    [grid.count_neighbors(index, ord("@")) for index in grid.indices()],
+                )
+
+    def test_copy_is_independent(self):
+        grid = PaddedGrid.from_rows(["@@", "@@"])
+        copy = grid.copy()
+        copy.set(0, 0, ".")
+        self.assertEqual(grid.get(0, 0), "@")
+        self.assertEqual(copy.get(0, 0), ".")
+
+    @unittest.skipUnless(find_spec("numpy"), "numpy is not installed")
+    def test_view_shares_cells(self):
+        grid = PaddedGrid.from_rows(["..@", "@@."], pad=2)
+        view = grid.view()
+        self.assertEqual(view.shape, (2, 3))
+        view[0, 0] = ord("@")
+        self.assertEqual(grid.get(0, 0), "@")
+        self.assertEqual(grid.view(padded=True).shape, (6, 7))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from aoc.registry import SOLVERS, Engine, Solver, get_solver
+from aoc.runner import check_engines
+from day02.id_index import open_index
+
+solver = Solver(
+    1,
+    1,
+    "day01.dial_01",
+    "day01/input_long.txt",
+    engines=(
+        Engine("small", "day01.dial_01", min_size=10),
+        Engine("large", "day01.dial_01", min_size=1000),
+        Engine("manual", "day01.dial_01", min_size=None),
+        Engine("missing", "day01.dial_01", min_size=100, requires=("no_such_module",)),
+    ),
+)
+
+
+class TestSelectEngine(unittest.TestCase):
+    def test_largest_threshold_not_above_size(self):
+        self.assertEqual(solver.select_engine(0).name, "reference")
+        self.assertEqual(solver.select_engine(10).name, "small")
+        self.assertEqual(solver.select_engine(999).name, "small")
+        self.assertEqual(solver.select_engine(1000).name, "large")
+
+    def test_named_engines(self):
+        self.assertEqual(solver.engine("manual").name, "manual")
+        with self.assertRaises(ValueError):
+            solver.engine("missing")
+        with self.assertRaises(ValueError):
+            solver.engine("unknown")
+
+    def test_unknown_solver(self):
+        with self.assertRaises(ValueError):
+            get_solver(99, 1)
+
+
+class TestRegisteredSolvers(unittest.TestCase):
+    def test_every_engine_loads(self):
+        """Module, parse and solve names of every available engine resolve."""
+        for registered in SOLVERS.values():
+            for engine in registered.all_engines:
+                if engine.is_available():
+                    with self.subTest(solver=registered.key, engine=engine.name):
+                        parse_input, solve = engine.load()
+                        self.assertTrue(callable(parse_input))
+                        self.assertTrue(callable(solve))
+
+    def test_engines_agree_on_samples(self):
+        # the day02 index engine builds its index on first use
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        environment = mock.patch.dict(os.environ, {"AOC_INDEX_DIR": directory.name})
+        environment.start()
+        self.addCleanup(environment.stop)
+        open_index.cache_clear()
+        self.addCleanup(open_index.cache_clear)
+
+        for registered in SOLVERS.values():
+            if registered.sample_path is None:
+                continue
+            answers = check_engines(registered, registered.sample_path, registered.sample_params)
+            for engine, answer in answers.items():
+                with self.subTest(solver=registered.key, engine=engine):
+                    self.assertEqual(answer, answers["reference"])
+
+    def test_bundled_inputs_exist(self):
+        for registered in SOLVERS.values():
+            with self.subTest(solver=registered.key):
+                self.assertTrue(registered.input_path.exists())
+                if registered.sample_path is not None:
+                    self.assertTrue(registered.sample_path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+
+from aoc.client import request
+from aoc.registry import get_solver
+from aoc.runner import run_solver
+from aoc.server import SolverServer
+
+
+class TestSolverServer(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.socket_path = os.path.join(directory.name, "aoc.sock")
+
+        self.server = SolverServer(self.socket_path, workers=1, use_cache=False)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.shutdown)
+
+        self.solver = get_solver(3, 2)
+        self.expected = run_solver(self.solver, self.solver.sample_path).answer
+
+    def test_path_and_bytes_requests(self):
+        header = {"day": 3, "part": 2, "engine": None}
+        by_path = request(self.socket_path, {**header, "path": str(self.solver.sample_path)})
+        by_bytes = request(self.socket_path, header, self.solver.sample_path.read_bytes())
+        self.assertEqual(by_path, {"ok": True, "answer": self.expected, "engine": "reference"})
+        self.assertEqual(by_bytes, by_path)
+
+    def test_errors(self):
+        unknown = request(self.socket_path, {"day": 99, "part": 1, "path": "x"})
+        self.assertFalse(unknown["ok"])
+        self.assertIn("No solver for day 99", unknown["error"])
+        malformed = request(self.socket_path, {"day": 3, "part": 2})
+        self.assertFalse(malformed["ok"])
+        self.assertIn("bad request", malformed["error"])
+
+    def test_broken_pool_is_replaced(self):
+        """A request caught in a broken pool is retried on a fresh one."""
+        self.server.pool.shutdown()
+        broken = mock.Mock()
+        broken.submit.side_effect = BrokenProcessPool()
+        self.server.pool = broken
+
+        response = self.server.solve(3, 2, str(self.solver.sample_path), {}, None)
+        self.assertEqual(response["answer"], self.expected)
+        self.assertIsNot(self.server.pool, broken)
+        broken.shutdown.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
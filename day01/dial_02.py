@@ -1,8 +1,10 @@
+from collections.abc import Iterable, Iterator
 from operator import ne
-import sys
 
+from aoc.input import Source, iter_lines, open_input, source_from_argv
 
-def count_rotations(start_position: int, lines: list[str]) -> int:
+
+def count_rotations(start_position: int, lines: Iterable[str]) -> int:
     position = start_position
     rotations = 0
 
@@ -27,20 +29,20 @@ def count_rotations(start_position: int, lines: list[str]) -> int:
     return rotations
 
 
-def parse_input() -> list[str]:
-    if len(sys.argv) > 1:
-        with open(sys.argv[1], "r", encoding="utf-8") as file:
-            lines = file.readlines()
-    else:
-        lines = sys.stdin.readlines()
+def parse_input(source: Source = None) -> Iterator[str]:
+    # the file stays mapped until the lines are used up
+    with open_input(source) as data:
+        yield from iter_lines(data)
+
 
-    return [line.strip() for line in lines]
+def solve(lines: Iterable[str]) -> int:
+    start_position = 50
+    return count_rotations(start_position, lines)
 
 
 def main() -> None:
-    lines = parse_input()
-    start_position = 50
-    result = count_rotations(start_position, lines)
+    lines = parse_input(source_from_argv())
+    result = solve(lines)
     print(result)
 
 
@@ -0,0 +1,146 @@
+"""
+Prefix index over a rotation log for range queries.
+
+The index keeps the dial position after every move and running totals of
+zero landings and zero passes, so the counts for moves ``i`` to ``j``, from
+the position the dial actually had at move ``i``, are two subtractions.
+New moves are appended in O(1) each, and the index can be saved and loaded
+again so it only has to be built once per log.
+
+    python -m day01.dial_index day01/input_long.txt 100 200
+"""
+
+import sys
+from array import array
+from collections.abc import Iterable
+from os import PathLike
+from typing import Self
+
+from aoc.input import Source, decode_moves, open_input
+
+_MAGIC = b"AOCDIAL1"
+
+
+class RotationIndex:
+    def __init__(self, start_position: int = 50) -> None:
+        # entry k describes the dial after the first k moves
+        self.positions = array("b", [start_position])
+        self.zero_positions = array("q", [0])
+        self.rotations = array("q", [0])
+
+    def __len__(self) -> int:
+        """Number of moves indexed."""
+        return len(self.positions) - 1
+
+    def append(self, move: int) -> None:
+        self.extend((move,))
+
+    def extend(self, moves: Iterable[int]) -> None:
+        position = self.positions[-1]
+        zero_positions = self.zero_positions[-1]
+        rotations = self.rotations[-1]
+
+        for move in moves:
+            next_position = position + move
+            if move > 0:
+                rotations += next_position // 100
+            elif move < 0:
+                rotations += ((position - 1) // 100) - ((next_position - 1) // 100)
+            position = next_position % 100
+            zero_positions += position == 0
+
+            self.positions.append(position)
+            self.zero_positions.append(zero_positions)
+            self.rotations.append(rotations)
+
+    def position(self, i: int) -> int:
+        """The dial position before move ``i``."""
+        return self.positions[i]
+
+    def zero_positions_between(self, i: int, j: int) -> int:
+        """
+        How many of moves ``i`` to ``j - 1`` end on zero.
+
+        >>> index = RotationIndex.from_source(b"L68 L30 R48 L5 R60 L55 L1 L99 R14 L82")
+        >>> index.zero_positions_between(0, len(index))
+        3
+        >>> index.zero_positions_between(2, 6)
+        2
+        """
+        return self.zero_positions[j] - self.zero_positions[i]
+
+    def rotations_between(self, i: int, j: int) -> int:
+        """
+        How often moves ``i`` to ``j - 1`` point the dial at zero.
+
+        >>> index = RotationIndex.from_source(b"L68 L30 R48 L5 R60 L55 L1 L99 R14 L82")
+        >>> index.rotations_between(0, len(index))
+        6
+        >>> index.rotations_between(4, 7)
+        2
+        """
+        return self.rotations[j] - self.rotations[i]
+
+    @classmethod
+    def from_source(cls, source: Source = None, start_position: int = 50) -> Self:
+        index = cls(start_position)
+        with open_input(source) as data:
+            index.extend(decode_moves(data))
+        return index
+
+    def save(self, path: str | PathLike[str]) -> None:
+        """Write the index in native byte order, for ``load`` on the same machine."""
+        with open(path, "wb") as file:
+            file.write(_MAGIC)
+            array("q", [len(self)]).tofile(file)
+            self.positions.tofile(file)
+            self.zero_positions.tofile(file)
+            self.rotations.tofile(file)
+
+    @classmethod
+    def load(cls, path: str | PathLike[str]) -> Self:
+        index = cls()
+        with open(path, "rb") as file:
+            if file.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{path} is not a rotation index")
+            header = array("q")
+            header.fromfile(file, 1)
+            size = header[0] + 1
+
+            index.positions = array("b")
+            index.positions.fromfile(file, size)
+            index.zero_positions = array("q")
+            index.zero_positions.fromfile(file, size)
+            index.rotations = array("q")
+            index.rotations.fromfile(file, size)
+        return index
+
+
+def parse_input(source: Source = None) -> RotationIndex:
+    return RotationIndex.from_source(source)
+
+
+def solve_zero_positions(index: RotationIndex) -> int:
+    return index.zero_positions_between(0, len(index))
+
+
+def solve_rotations(index: RotationIndex) -> int:
+    return index.rotations_between(0, len(index))
+
+
+def main() -> None:
+    if len(sys.argv) not in (2, 4):
+        sys.exit("Usage: python -m day01.dial_index <input_file> [<from_move> <to_move>]")
+
+    index = RotationIndex.from_source(sys.argv[1])
+    if len(sys.argv) == 4:
+        i, j = int(sys.argv[2]), int(sys.argv[3])
+    else:
+        i, j = 0, len(index)
+    print(f"position at move {i}: {index.position(i)}")
+    print(f"zero positions: {index.zero_positions_between(i, j)}")
+    print(f"rotations: {index.rotations_between(i, j)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Vectorized engine for both parts of day 1.
+
+Moves are decoded straight from the input bytes into one signed int64 array
+and the dial is followed with a cumulative sum instead of a Python loop.
+"""
+
+import numpy as np
+
+from aoc.input import Buffer, Source, iter_chunks, open_input, source_from_argv
+
+# int64 holds any amount of up to 18 digits
+MAX_DIGITS = 18
+
+_INVALID, _SPACE, _DIGIT, _RIGHT, _LEFT = range(5)
+_BYTE_KINDS = np.zeros(256, dtype=np.uint8)
+_BYTE_KINDS[list(b" \t\r\n")] = _SPACE
+_BYTE_KINDS[list(b"0123456789")] = _DIGIT
+_BYTE_KINDS[ord("R")] = _RIGHT
+_BYTE_KINDS[ord("L")] = _LEFT
+
+
+def _decode_chunk(chunk: bytes) -> np.ndarray:
+    buffer = np.frombuffer(chunk, dtype=np.uint8)
+    kinds = np.take(_BYTE_KINDS, buffer)
+    is_digit = kinds == _DIGIT
+    is_letter = kinds >= _RIGHT
+
+    run_edge = is_digit[1:] != is_digit[:-1]
+    starts = np.flatnonzero(run_edge & is_digit[1:]) + 1
+    ends = np.flatnonzero(run_edge & is_digit[:-1]) + 1
+    if is_digit[:1].any():
+        starts = np.insert(starts, 0, 0)
+    if is_digit[-1:].any():
+        ends = np.append(ends, buffer.size)
+
+    # each amount directly follows its direction letter, nothing else is allowed
+    letters = np.flatnonzero(is_letter)
+    if (kinds == _INVALID).any() or not np.array_equal(letters + 1, starts):
+        raise ValueError("Invalid move in input")
+
+    lengths = ends - starts
+    width = int(lengths.max(initial=0))
+    if width > MAX_DIGITS:
+        raise ValueError(f"Move amount longer than {MAX_DIGITS} digits")
+
+    # add up the amounts one decimal place at a time, ones first
+    amounts = np.zeros(starts.size, dtype=np.int64)
+    for place in range(width):
+        place_digits = buffer[ends - 1 - place].astype(np.int64) - ord("0")
+        amounts += np.where(lengths > place, place_digits, 0) * 10**place
+
+    return np.where(kinds[letters] == _LEFT, -amounts, amounts)
+
+
+def decode_moves(data: Buffer) -> np.ndarray:
+    """
+    Decode ``R12``/``L7`` moves into a signed int64 array, right turns positive.
+
+    >>> decode_moves(b"R12\\nL7\\nR0\\n").tolist()
+    [12, -7, 0]
+    """
+    chunks = [_decode_chunk(chunk) for chunk in iter_chunks(data)]
+    return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int64)
+
+
+def dial_path(start_position: int, moves: np.ndarray) -> np.ndarray:
+    """
+    Unwrapped dial position before the first move and after each move.
+
+    Every amount fits in int64 but their running sum may not; when it could
+    overflow, the path is summed with Python ints in an object array, which
+    is exact like the reference engines, only slower.
+
+    >>> dial_path(50, decode_moves(b"R999999999999999999\\n" * 10))[-1]
+    10000000000000000040
+    """
+    bound = abs(start_position) + int(np.abs(moves).max(initial=0)) * moves.size
+    # the count functions subtract 1 and floor divide the positions
+    if bound >= np.iinfo(np.int64).max - 100:
+        return np.cumsum(np.concatenate(([start_position], moves)).astype(object))
+
+    path = np.empty(moves.size + 1, dtype=np.int64)
+    path[0] = start_position
+    np.cumsum(moves, out=path[1:])
+    path[1:] += start_position
+    return path
+
+
+def count_zero_positions(start_position: int, moves: np.ndarray) -> int:
+    """
+    >>> count_zero_positions(50, decode_moves(b"L68 L30 R48 L5 R60 L55 L1 L99 R14 L82"))
+    3
+    """
+    path = dial_path(start_position, moves)
+    return int(np.count_nonzero(path[1:] % 100 == 0))
+
+
+def count_rotations(start_position: int, moves: np.ndarray) -> int:
+    """
+    Count every click that lands on 0, including those in the middle of a move.
+
+    A right turn from ``a`` to ``b`` passes the multiples of 100 in ``(a, b]``
+    and a left turn those in ``[b, a)``; both counts are differences of floor
+    divisions of the unwrapped positions.
+
+    >>> count_rotations(50, decode_moves(b"L68 L30 R48 L5 R60 L55 L1 L99 R14 L82"))
+    6
+    >>> count_rotations(0, decode_moves(b"L100 R0 L0"))
+    1
+    """
+    path = dial_path(start_position, moves)
+    right_turns = np.diff(path // 100)
+    left_turns = -np.diff((path - 1) // 100)
+    return int(np.where(moves > 0, right_turns, left_turns).sum())
+
+
+def parse_input(source: Source = None) -> np.ndarray:
+    with open_input(source) as data:
+        return decode_moves(data)
+
+
+def solve_zero_positions(moves: np.ndarray) -> int:
+    return count_zero_positions(50, moves)
+
+
+def solve_rotations(moves: np.ndarray) -> int:
+    return count_rotations(50, moves)
+
+
+def main() -> None:
+    moves = parse_input(source_from_argv())
+    print(solve_zero_positions(moves))
+    print(solve_rotations(moves))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Multi-process engine for both parts of day 1.
+
+What a run of moves does to the dial only depends on where the dial starts,
+so a run can be summarised without knowing its start position: its net
+displacement plus, for each of the 100 start positions, how often it lands
+on zero and how often it passes zero. Summaries of consecutive runs compose
+associatively, so the log is split into newline-aligned byte ranges, each
+range is summarised in its own process and the summaries are folded in
+order.
+"""
+
+import functools
+import math
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from aoc.input import Buffer, Source, decode_moves, open_input, read_input, source_from_argv
+
+# upper bound on the bytes one worker decodes at a time
+RANGE_SIZE = 64 << 20
+
+type Log = str | bytes
+
+
+class Summary(NamedTuple):
+    """The effect of a run of moves, indexed by the start position."""
+
+    displacement: int
+    zero_positions: tuple[int, ...]
+    rotations: tuple[int, ...]
+
+    def then(self, other: "Summary") -> "Summary":
+        """
+        The summary of this run followed by ``other``.
+
+        >>> a, b = summarize([-50]), summarize([30, 70])
+        >>> a.then(b).rotations[50], summarize([-50, 30, 70]).rotations[50]
+        (2, 2)
+        """
+        shift = self.displacement
+        return Summary(
+            shift + other.displacement,
+            tuple(
+                count + other.zero_positions[(start + shift) % 100]
+                for start, count in enumerate(self.zero_positions)
+            ),
+            tuple(
+                count + other.rotations[(start + shift) % 100]
+                for start, count in enumerate(self.rotations)
+            ),
+        )
+
+
+EMPTY = Summary(0, (0,) * 100, (0,) * 100)
+
+
+def summarize(moves: Iterable[int]) -> Summary:
+    """
+    Follow the moves once from position 0 and record where they land.
+
+    Started at ``p`` instead, the dial is at ``p + offset`` and
+    ``(p + x) // 100`` is ``x // 100``, plus one when ``x % 100 + p`` reaches
+    100. So the zero passes from ``p`` are those from 0 plus a sum over the
+    histogram of residues at or above ``100 - p``.
+    """
+    offset = 0
+    passes = 0
+    pass_residues = [0] * 100
+    landing_residues = [0] * 100
+
+    for move in moves:
+        next_offset = offset + move
+        if move > 0:
+            passes += next_offset // 100 - offset // 100
+            pass_residues[next_offset % 100] += 1
+            pass_residues[offset % 100] -= 1
+        elif move < 0:
+            passes += (offset - 1) // 100 - (next_offset - 1) // 100
+            pass_residues[(offset - 1) % 100] += 1
+            pass_residues[(next_offset - 1) % 100] -= 1
+        landing_residues[next_offset % 100] += 1
+        offset = next_offset
+
+    rotations = [passes]
+    for start in range(1, 100):
+        rotations.append(rotations[-1] + pass_residues[100 - start])
+
+    return Summary(
+        offset,
+        tuple(landing_residues[-start % 100] for start in range(100)),
+        tuple(rotations),
+    )
+
+
+def split_ranges(data: Buffer, count: int) -> list[tuple[int, int]]:
+    """
+    Cut ``data`` into at most ``count`` ranges of similar size that end on a
+    line boundary.
+
+    >>> split_ranges(b"R1\\nL22\\nR3\\n", 3)
+    [(0, 3), (3, 7), (7, 10)]
+    """
+    size = len(data)
+    ranges = []
+    start = 0
+    for part in range(1, count + 1):
+        if start >= size:
+            break
+        newline = data.find(b"\n", max(start, size * part // count - 1))
+        end = size if newline == -1 or part == count else newline + 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _summarize_bytes(data: bytes) -> Summary:
+    return summarize(decode_moves(data))
+
+
+def _summarize_file_range(path: str, start: int, end: int) -> Summary:
+    with open(path, "rb") as file:
+        file.seek(start)
+        return _summarize_bytes(file.read(end - start))
+
+
+def summarize_log(log: Log, workers: int | None = None) -> Summary:
+    workers = workers or os.cpu_count() or 1
+    # a path is mapped only to find the range boundaries
+    with open_input(log) as data:
+        ranges = split_ranges(data, max(workers, math.ceil(len(data) / RANGE_SIZE)))
+
+        if workers == 1 or len(ranges) <= 1:
+            summaries = [_summarize_bytes(data[start:end]) for start, end in ranges]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_summarize_bytes, data[start:end])
+                    if isinstance(log, bytes)
+                    else pool.submit(_summarize_file_range, log, start, end)
+                    for start, end in ranges
+                ]
+                summaries = [future.result() for future in futures]
+
+    return functools.reduce(Summary.then, summaries, EMPTY)
+
+
+def parse_input(source: Source = None) -> Log:
+    """Workers read their own ranges, so only stdin is read here."""
+    if source is None or isinstance(source, bytes):
+        return bytes(read_input(source))
+    return os.fspath(source)
+
+
+def solve_zero_positions(log: Log, workers: int | None = None) -> int:
+    return summarize_log(log, workers).zero_positions[50]
+
+
+def solve_rotations(log: Log, workers: int | None = None) -> int:
+    return summarize_log(log, workers).rotations[50]
+
+
+def main() -> None:
+    summary = summarize_log(parse_input(source_from_argv()))
+    print(summary.zero_positions[50])
+    print(summary.rotations[50])
+
+
+if __name__ == "__main__":
+    main()
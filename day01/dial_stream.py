@@ -0,0 +1,64 @@
+"""
+Constant-memory engine for both parts of day 1.
+
+The input is read in fixed-size blocks and each block is decoded into signed
+moves, which update the dial position and the counts before the next block
+is read. Memory stays at about one block whatever the size of the log, and
+stdin is consumed as it arrives, so it can sit at the end of a pipe:
+
+    zcat rotations.log.gz | python -m aoc run 1 2 --engine stream
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator
+
+from aoc.input import Source, decode_moves, source_from_argv, stream_chunks
+
+
+def parse_input(source: Source = None) -> Iterator[array[int]]:
+    return (decode_moves(chunk) for chunk in stream_chunks(source))
+
+
+def count_zero_positions(start_position: int, chunks: Iterable[array[int]]) -> int:
+    position = start_position
+    zero_positions = 0
+
+    for moves in chunks:
+        for move in moves:
+            position = (position + move) % 100
+            zero_positions += position == 0
+
+    return zero_positions
+
+
+def count_rotations(start_position: int, chunks: Iterable[array[int]]) -> int:
+    position = start_position
+    rotations = 0
+
+    for moves in chunks:
+        for move in moves:
+            next_position = position + move
+            if move > 0:
+                rotations += next_position // 100
+            elif move < 0:
+                rotations += ((position - 1) // 100) - ((next_position - 1) // 100)
+            position = next_position % 100
+
+    return rotations
+
+
+def solve_zero_positions(chunks: Iterable[array[int]]) -> int:
+    return count_zero_positions(50, chunks)
+
+
+def solve_rotations(chunks: Iterable[array[int]]) -> int:
+    return count_rotations(50, chunks)
+
+
+def main() -> None:
+    # a pipe can only be read once, so this prints part 2 only
+    print(solve_rotations(parse_input(source_from_argv())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import random
+import unittest
+from importlib.util import find_spec
+
+from day01.dial_01 import count_zero_positions as reference_zero_positions
+from day01.dial_02 import count_rotations as reference_rotations
+
+# numpy is optional, like the engine under test
+HAS_NUMPY = find_spec("numpy") is not None
+if HAS_NUMPY:
+    from day01.dial_numpy import count_rotations, count_zero_positions, decode_moves
+
+
+def encode(lines):
+    return "\n".join(lines).encode()
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+class TestMatchesReference(unittest.TestCase):
+    def assert_same(self, start, lines):
+        moves = decode_moves(encode(lines))
+        self.assertEqual(
+            count_zero_positions(start, moves), reference_zero_positions(start, lines)
+        )
+        self.assertEqual(count_rotations(start, moves), reference_rotations(start, lines))
+
+    def test_left_turn_edge_cases(self):
+        """Left turns that start, end or pass on zero."""
+        for lines in (["L50"], ["L100"], ["L300"], ["L50", "L1"], ["L50", "L100"]):
+            for start in (0, 1, 50, 99):
+                with self.subTest(start=start, lines=lines):
+                    self.assert_same(start, lines)
+
+    def test_zero_movement(self):
+        """Zero moves on zero count in part 1 only."""
+        self.assert_same(0, ["R0", "L0"])
+        self.assert_same(50, ["R0", "L0"])
+
+    def test_random_moves(self):
+        """Random logs with amounts below and above a full turn."""
+        rng = random.Random(1)
+        for _ in range(50):
+            lines = [
+                f"{rng.choice('RL')}{rng.randrange(0, 350)}"
+                for _ in range(rng.randrange(0, 200))
+            ]
+            self.assert_same(rng.randrange(100), lines)
+
+    def test_running_sum_past_int64(self):
+        """18-digit amounts whose sum overflows int64 still count exactly."""
+        rng = random.Random(2)
+        for _ in range(10):
+            lines = [
+                f"{rng.choice('RL')}{rng.randrange(10**17, 10**18)}"
+                for _ in range(rng.randrange(10, 40))
+            ]
+            self.assert_same(rng.randrange(100), lines)
+
+
+if __name__ == "__main__":
+    unittest.main()
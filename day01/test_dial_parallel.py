@@ -0,0 +1,46 @@
+import functools
+import random
+import unittest
+
+from aoc.input import decode_moves
+from day01.dial_01 import count_zero_positions
+from day01.dial_02 import count_rotations
+from day01.dial_parallel import EMPTY, Summary, split_ranges, summarize
+
+
+class TestSummaries(unittest.TestCase):
+    def test_split_summaries_match_reference(self):
+        """Folding the summaries of any split matches a sequential count."""
+        rng = random.Random(1)
+        for _ in range(30):
+            lines = [
+                f"{rng.choice('RL')}{rng.randrange(0, 350)}"
+                for _ in range(rng.randrange(0, 200))
+            ]
+            data = "\n".join(lines).encode()
+            for count in (1, 2, 7):
+                ranges = split_ranges(data, count)
+                self.assertEqual(b"".join(data[start:end] for start, end in ranges), data)
+
+                summary = functools.reduce(
+                    Summary.then,
+                    [summarize(decode_moves(data[start:end])) for start, end in ranges],
+                    EMPTY,
+                )
+                for start in (0, 1, 50, 99):
+                    with self.subTest(count=count, start=start):
+                        self.assertEqual(
+                            summary.zero_positions[start],
+                            count_zero_positions(start, lines),
+                        )
+                        self.assertEqual(
+                            summary.rotations[start], count_rotations(start, lines)
+                        )
+
+    def test_composition_is_associative(self):
+        a, b, c = summarize([-50, 250]), summarize([-1, 0]), summarize([99, -300])
+        self.assertEqual(a.then(b).then(c), a.then(b.then(c)))
+
+
+if __name__ == "__main__":
+    unittest.main()
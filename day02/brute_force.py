@@ -0,0 +1,146 @@
+"""
+Multi-process brute force for day 2 with a pluggable invalidity rule.
+
+The ID ranges are cut at powers of ten, so the digit count is fixed within
+each piece, and then into pieces of similar width that are checked in a
+process pool. A rule is any module-level function ``(id_, digits) -> bool``
+(it has to be picklable); new rules get the parallel path by passing them to
+``sum_invalid_ids``.
+
+The two puzzle rules use only integer arithmetic: an ID of ``digits`` digits
+repeats a ``block``-digit block exactly when it is divisible by
+``(10**digits - 1) // (10**block - 1)``.
+"""
+
+import math
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+from aoc.input import Source, decode_ranges, open_input, source_from_argv
+
+type Predicate = Callable[[int, int], bool]
+
+# pieces per worker, so uneven pieces still keep every worker busy
+PIECES_PER_WORKER = 4
+
+# longest ID the built-in rules have lookup tables for
+MAX_DIGITS = 40
+
+_HALF_MULTIPLIERS = tuple(
+    10 ** (digits // 2) + 1 if digits % 2 == 0 else 0 for digits in range(MAX_DIGITS + 1)
+)
+_PERIOD_MULTIPLIERS = tuple(
+    tuple(
+        (10**digits - 1) // (10**block - 1)
+        for block in range(1, digits // 2 + 1)
+        if digits % block == 0
+    )
+    for digits in range(MAX_DIGITS + 1)
+)
+
+
+def is_doubled(id_: int, digits: int) -> bool:
+    """
+    >>> is_doubled(123123, 6), is_doubled(12312, 5), is_doubled(1010, 4)
+    (True, False, True)
+    """
+    multiplier = _HALF_MULTIPLIERS[digits]
+    return multiplier != 0 and id_ % multiplier == 0
+
+
+def is_repeated(id_: int, digits: int) -> bool:
+    """
+    >>> is_repeated(121212, 6), is_repeated(1111111, 7), is_repeated(1213, 4)
+    (True, True, False)
+    """
+    for multiplier in _PERIOD_MULTIPLIERS[digits]:
+        if id_ % multiplier == 0:
+            return True
+    return False
+
+
+def split_ranges(
+    ranges: list[tuple[int, int]], pieces: int
+) -> list[tuple[int, int, int]]:
+    """
+    Cut the ranges into ``(lower, upper, digits)`` pieces of at most about
+    ``1 / pieces`` of the total width, none crossing a power of ten.
+
+    >>> split_ranges([(95, 115)], 1)
+    [(95, 99, 2), (100, 115, 3)]
+    >>> split_ranges([(1, 8)], 2)
+    [(1, 4, 1), (5, 8, 1)]
+    """
+    total = sum(upper - lower + 1 for lower, upper in ranges)
+    width = max(1, math.ceil(total / pieces))
+
+    split = []
+    for lower, upper in ranges:
+        while lower <= upper:
+            digits = len(str(lower))
+            last = min(upper, 10**digits - 1, lower + width - 1)
+            split.append((lower, last, digits))
+            lower = last + 1
+    return split
+
+
+def _sum_piece(predicate: Predicate, lower: int, upper: int, digits: int) -> int:
+    total = 0
+    for id_ in range(lower, upper + 1):
+        if predicate(id_, digits):
+            total += id_
+    return total
+
+
+def sum_invalid_ids(
+    ranges: list[tuple[int, int]], predicate: Predicate, workers: int | None = None
+) -> int:
+    workers = workers or os.cpu_count() or 1
+    pieces = split_ranges(ranges, workers * PIECES_PER_WORKER)
+
+    if workers == 1:
+        return sum(_sum_piece(predicate, *piece) for piece in pieces)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_sum_piece, predicate, *piece) for piece in pieces]
+        return sum(future.result() for future in futures)
+
+
+def parse_input(source: Source = None) -> list[tuple[int, int]]:
+    with open_input(source) as data:
+        return decode_ranges(data)
+
+
+def check_ranges(ranges: list[tuple[int, int]]) -> None:
+    """
+    >>> check_ranges([(1, 10**40)])
+    Traceback (most recent call last):
+    ...
+    ValueError: IDs longer than 40 digits are not supported: 1-10000000000000000000000000000000000000000
+    """
+    for lower, upper in ranges:
+        if upper >= 10**MAX_DIGITS:
+            raise ValueError(
+                f"IDs longer than {MAX_DIGITS} digits are not supported: {lower}-{upper}"
+            )
+
+
+def solve_doubled(ranges: list[tuple[int, int]], workers: int | None = None) -> int:
+    check_ranges(ranges)
+    return sum_invalid_ids(ranges, is_doubled, workers)
+
+
+def solve_repeated(ranges: list[tuple[int, int]], workers: int | None = None) -> int:
+    check_ranges(ranges)
+    return sum_invalid_ids(ranges, is_repeated, workers)
+
+
+def main() -> None:
+    ranges = parse_input(source_from_argv())
+    print(solve_doubled(ranges))
+    print(solve_repeated(ranges))
+
+
+if __name__ == "__main__":
+    main()
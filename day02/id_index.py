@@ -0,0 +1,199 @@
+"""
+Precomputed index of every invalid ID up to a number of digits.
+
+For each rule the index holds the sorted invalid IDs and their prefix sums
+as int64 arrays, so the sum over an ID range is two bisections and one
+subtraction however many ranges a request sends. The arrays are written to
+one file and memory-mapped on load, which makes opening an index cost
+nothing but the mapping.
+
+    python -m day02.id_index --max-digits 12 -o ids.bin
+
+The engine builds its index on first use into ``index_directory()``, which
+is ``$AOC_INDEX_DIR`` or an ``-indexes`` sibling of the cache directory.
+Indexes are not cache entries: they do not count towards the cache's
+``max_bytes`` and are never evicted, but can be deleted at any time and are
+rebuilt when needed. Ranges beyond the index fall back to
+``day02.repeated``.
+"""
+
+import argparse
+import functools
+import mmap
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Self
+
+from aoc.cache import default_directory
+from aoc.input import Source, decode_ranges, open_input
+from day02.repeated import doubled_ids, repeated_ids, sum_doubled_ids, sum_repeated_ids
+
+DEFAULT_MAX_DIGITS = 12
+
+_MAGIC = b"AOCIDS01"
+# max digits, doubled count, repeated count
+_HEADER_SIZE = 3 * 8
+
+# prefix sums past this many digits no longer fit in int64
+_MAX_DIGITS_LIMIT = 13
+
+
+class SortedIds:
+    def __init__(self, ids: Sequence[int], prefix_sums: Sequence[int]) -> None:
+        self.ids = ids
+        self.prefix_sums = prefix_sums
+
+    @classmethod
+    def build(cls, ids: Iterator[int]) -> Self:
+        sorted_ids = array("q", ids)
+        prefix_sums = array("q", [0])
+        total = 0
+        for id_ in sorted_ids:
+            total += id_
+            prefix_sums.append(total)
+        return cls(sorted_ids, prefix_sums)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def count_between(self, lower_bound: int, upper_bound: int) -> int:
+        return bisect_right(self.ids, upper_bound) - bisect_left(self.ids, lower_bound)
+
+    def sum_between(self, lower_bound: int, upper_bound: int) -> int:
+        """
+        >>> SortedIds.build(iter([11, 22, 99, 1010])).sum_between(20, 1000)
+        121
+        """
+        first = bisect_left(self.ids, lower_bound)
+        last = bisect_right(self.ids, upper_bound)
+        return self.prefix_sums[last] - self.prefix_sums[first]
+
+
+class IdIndex:
+    def __init__(self, max_digits: int, doubled: SortedIds, repeated: SortedIds) -> None:
+        self.max_digits = max_digits
+        self.doubled = doubled
+        self.repeated = repeated
+
+    @property
+    def limit(self) -> int:
+        """Every invalid ID below this is indexed."""
+        return 10**self.max_digits
+
+    @classmethod
+    def build(cls, max_digits: int = DEFAULT_MAX_DIGITS) -> Self:
+        if not 1 <= max_digits <= _MAX_DIGITS_LIMIT:
+            raise ValueError(f"max_digits must be between 1 and {_MAX_DIGITS_LIMIT}")
+
+        upper_bound = 10**max_digits - 1
+        return cls(
+            max_digits,
+            SortedIds.build(doubled_ids(1, upper_bound)),
+            SortedIds.build(repeated_ids(1, upper_bound)),
+        )
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the index in native byte order, for ``load`` on the same machine."""
+        with open(path, "wb") as file:
+            file.write(_MAGIC)
+            header = array("q", [self.max_digits, len(self.doubled), len(self.repeated)])
+            header.tofile(file)
+            for part in (self.doubled, self.repeated):
+                array("q", part.ids).tofile(file)
+                array("q", part.prefix_sums).tofile(file)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> Self:
+        """Map a saved index; the arrays are views on the file, not copies."""
+        with open(path, "rb") as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(data)
+        if view[: len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"{path} is not an invalid ID index")
+
+        offset = len(_MAGIC)
+        max_digits, *counts = view[offset : offset + _HEADER_SIZE].cast("q")
+        offset += _HEADER_SIZE
+
+        parts = []
+        for count in counts:
+            ids = view[offset : offset + count * 8].cast("q")
+            offset += count * 8
+            prefix_sums = view[offset : offset + (count + 1) * 8].cast("q")
+            offset += (count + 1) * 8
+            parts.append(SortedIds(ids, prefix_sums))
+
+        return cls(max_digits, *parts)
+
+
+def index_directory() -> Path:
+    if directory := os.environ.get("AOC_INDEX_DIR"):
+        return Path(directory)
+    cache = default_directory()
+    return cache.with_name(f"{cache.name}-indexes")
+
+
+def index_path(max_digits: int) -> Path:
+    return index_directory() / f"day02-ids-{max_digits}.bin"
+
+
+@functools.cache
+def open_index(max_digits: int = DEFAULT_MAX_DIGITS) -> IdIndex:
+    """Load the shared index for ``max_digits``, building and saving it first if needed."""
+    path = index_path(max_digits)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        IdIndex.build(max_digits).save(temporary)
+        os.replace(temporary, path)
+    return IdIndex.load(path)
+
+
+def parse_input(source: Source = None) -> list[tuple[int, int]]:
+    with open_input(source) as data:
+        return decode_ranges(data)
+
+
+def solve_doubled(
+    ranges: list[tuple[int, int]], max_digits: int = DEFAULT_MAX_DIGITS
+) -> int:
+    index = open_index(max_digits)
+    return sum(
+        index.doubled.sum_between(lower, upper)
+        if upper < index.limit
+        else sum_doubled_ids(lower, upper)
+        for lower, upper in ranges
+    )
+
+
+def solve_repeated(
+    ranges: list[tuple[int, int]], max_digits: int = DEFAULT_MAX_DIGITS
+) -> int:
+    index = open_index(max_digits)
+    return sum(
+        index.repeated.sum_between(lower, upper)
+        if upper < index.limit
+        else sum_repeated_ids(lower, upper)
+        for lower, upper in ranges
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m day02.id_index")
+    parser.add_argument("--max-digits", type=int, default=DEFAULT_MAX_DIGITS)
+    parser.add_argument("-o", "--output", help="index file (default: in the index directory)")
+    args = parser.parse_args()
+
+    path = Path(args.output) if args.output else index_path(args.max_digits)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    index = IdIndex.build(args.max_digits)
+    index.save(path)
+    print(f"{len(index.doubled)} doubled and {len(index.repeated)} repeated IDs")
+
+
+if __name__ == "__main__":
+    main()
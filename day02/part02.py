@@ -1,7 +1,8 @@
 from functools import lru_cache
-import sys
 from typing import Generator
 
+from aoc.input import Source, decode_ranges, open_input, source_from_argv
+
 
 def divisors_generator(n: int) -> Generator[int, None, None]:
     for i in range(1, n // 2 + 1):
@@ -58,27 +59,19 @@ def count_invalid_ids(ranges: list[tuple[int, int]]) -> int:
     return sum_
 
 
-def parse_input() -> list[tuple[int, int]]:
-    if len(sys.argv) > 1:
-        with open(sys.argv[1], "r", encoding="utf-8") as file:
-            data = file.readline().strip()
-    else:
-        data = sys.stdin.readline().strip()
+def parse_input(source: Source = None) -> list[tuple[int, int]]:
+    with open_input(source) as data:
+        return decode_ranges(data)
+
 
-    result = []
-    for id_ranges in data.split(","):
-        id_range = tuple(map(int, id_ranges.split("-")))
-        if len(id_range) == 2:
-            result.append((id_range[0], id_range[1]))
-        else:
-            raise ValueError(f"Invalid range format: {id_ranges}")
-    return result
+def solve(ranges: list[tuple[int, int]]) -> int:
+    return count_invalid_ids(ranges)
 
 
 def main():
-    data = parse_input()
+    data = parse_input(source_from_argv())
 
-    sum_of_invalid_ranges = count_invalid_ids(data)
+    sum_of_invalid_ranges = solve(data)
 
     print(sum_of_invalid_ranges)
 
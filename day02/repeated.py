@@ -0,0 +1,163 @@
+"""
+Closed-form engine for both parts of day 2.
+
+A number made of a ``block``-digit number ``x`` repeated to fill ``digits``
+digits is ``x * (10**digits - 1) // (10**block - 1)``. So the repeated
+numbers of one length and block size inside a range are a range of ``x``
+found with two divisions, and their sum is an arithmetic series. The work
+per ID range depends on its number of digits, not on its width.
+
+Part 2 counts a number once even when several block sizes produce it, e.g.
+``222222`` from blocks 2, 22 and 222. By Möbius inversion over the divisors
+of ``digits``, the sum of every number with some proper period is
+``-sum(mobius(digits // block) * S(block))`` over the proper divisors, where
+``S(block)`` sums the numbers with period ``block``.
+"""
+
+import heapq
+from collections.abc import Iterator
+
+from aoc.input import Source, decode_ranges, open_input, source_from_argv
+
+
+def mobius(n: int) -> int:
+    """
+    >>> [mobius(n) for n in range(1, 11)]
+    [1, -1, -1, 0, -1, 1, -1, 0, 0, 1]
+    """
+    result = 1
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            n //= factor
+            if n % factor == 0:
+                return 0
+            result = -result
+        factor += 1
+    return -result if n > 1 else result
+
+
+def digit_lengths(lower_bound: int, upper_bound: int) -> range:
+    return range(len(str(lower_bound)), len(str(upper_bound)) + 1)
+
+
+def block_range(lower_bound: int, upper_bound: int, digits: int, block: int) -> range:
+    """
+    The ``block``-digit numbers whose repetition to ``digits`` digits lies in
+    ``[lower_bound, upper_bound]``.
+
+    >>> block_range(95, 115, 2, 1)
+    range(9, 10)
+    >>> block_range(998, 1012, 4, 2)
+    range(10, 11)
+    """
+    multiplier = (10**digits - 1) // (10**block - 1)
+    first = max(10 ** (block - 1), -(-lower_bound // multiplier))
+    last = min(10**block - 1, upper_bound // multiplier)
+    return range(first, last + 1)
+
+
+def periodic_sum(lower_bound: int, upper_bound: int, digits: int, block: int) -> int:
+    """Sum of the ``digits``-digit numbers in the range with period ``block``."""
+    blocks = block_range(lower_bound, upper_bound, digits, block)
+    if not blocks:
+        return 0
+    multiplier = (10**digits - 1) // (10**block - 1)
+    return multiplier * (blocks.start + blocks.stop - 1) * len(blocks) // 2
+
+
+def is_primitive(block: int) -> bool:
+    """Whether ``block`` is not itself a repetition of a shorter block."""
+    text = str(block)
+    return (text + text).find(text, 1) == len(text)
+
+
+def doubled_ids(lower_bound: int, upper_bound: int) -> Iterator[int]:
+    """
+    Numbers in the range made of one block written twice, in order.
+
+    >>> list(doubled_ids(11, 22)), list(doubled_ids(1188511880, 1188511890))
+    ([11, 22], [1188511885])
+    """
+    for digits in digit_lengths(lower_bound, upper_bound):
+        if digits % 2:
+            continue
+        multiplier = 10 ** (digits // 2) + 1
+        for block in block_range(lower_bound, upper_bound, digits, digits // 2):
+            yield block * multiplier
+
+
+def repeated_ids(lower_bound: int, upper_bound: int) -> Iterator[int]:
+    """
+    Numbers in the range made of one block written at least twice, in order
+    and each only once.
+
+    >>> list(repeated_ids(95, 115)), list(repeated_ids(222220, 222224))
+    ([99, 111], [222222])
+    """
+    for digits in digit_lengths(lower_bound, upper_bound):
+        yield from heapq.merge(
+            *(
+                _primitive_ids(lower_bound, upper_bound, digits, size)
+                for size in range(1, digits // 2 + 1)
+                if digits % size == 0
+            )
+        )
+
+
+def _primitive_ids(
+    lower_bound: int, upper_bound: int, digits: int, size: int
+) -> Iterator[int]:
+    # every number is generated from its shortest block only
+    multiplier = (10**digits - 1) // (10**size - 1)
+    for block in block_range(lower_bound, upper_bound, digits, size):
+        if is_primitive(block):
+            yield block * multiplier
+
+
+def sum_doubled_ids(lower_bound: int, upper_bound: int) -> int:
+    """
+    >>> sum_doubled_ids(11, 1012) == sum(doubled_ids(11, 1012))
+    True
+    """
+    return sum(
+        periodic_sum(lower_bound, upper_bound, digits, digits // 2)
+        for digits in digit_lengths(lower_bound, upper_bound)
+        if digits % 2 == 0
+    )
+
+
+def sum_repeated_ids(lower_bound: int, upper_bound: int) -> int:
+    """
+    >>> sum_repeated_ids(1, 10**7) == sum(repeated_ids(1, 10**7))
+    True
+    """
+    return sum(
+        -mobius(digits // size) * periodic_sum(lower_bound, upper_bound, digits, size)
+        for digits in digit_lengths(lower_bound, upper_bound)
+        for size in range(1, digits // 2 + 1)
+        if digits % size == 0
+    )
+
+
+def parse_input(source: Source = None) -> list[tuple[int, int]]:
+    with open_input(source) as data:
+        return decode_ranges(data)
+
+
+def solve_doubled(ranges: list[tuple[int, int]]) -> int:
+    return sum(sum_doubled_ids(lower, upper) for lower, upper in ranges)
+
+
+def solve_repeated(ranges: list[tuple[int, int]]) -> int:
+    return sum(sum_repeated_ids(lower, upper) for lower, upper in ranges)
+
+
+def main() -> None:
+    ranges = parse_input(source_from_argv())
+    print(solve_doubled(ranges))
+    print(solve_repeated(ranges))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import random
+import unittest
+
+from day02 import part01, part02
+from day02.brute_force import MAX_DIGITS, solve_doubled, solve_repeated, split_ranges
+
+
+class TestBruteForce(unittest.TestCase):
+    def test_matches_baseline(self):
+        rng = random.Random(17)
+        for _ in range(20):
+            ranges = []
+            for _ in range(rng.randrange(1, 5)):
+                lower = rng.randrange(1, 10 ** rng.randrange(1, 8))
+                ranges.append((lower, lower + rng.randrange(0, 2000)))
+            for workers in (1, 2):
+                with self.subTest(ranges=ranges, workers=workers):
+                    self.assertEqual(solve_doubled(ranges, workers), part01.solve(ranges))
+                    self.assertEqual(solve_repeated(ranges, workers), part02.solve(ranges))
+
+    def test_pieces_cover_ranges(self):
+        ranges = [(5, 1234), (98, 101)]
+        pieces = split_ranges(ranges, 7)
+        covered = sorted(id_ for lower, upper, _ in pieces for id_ in range(lower, upper + 1))
+        expected = sorted(id_ for lower, upper in ranges for id_ in range(lower, upper + 1))
+        self.assertEqual(covered, expected)
+        for lower, upper, digits in pieces:
+            self.assertEqual(len(str(lower)), digits)
+            self.assertEqual(len(str(upper)), digits)
+
+    def test_rejects_ids_past_the_rule_tables(self):
+        with self.assertRaises(ValueError):
+            solve_doubled([(1, 10**MAX_DIGITS)], 1)
+        with self.assertRaises(ValueError):
+            solve_repeated([(1, 10**MAX_DIGITS)], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from day02 import part01, part02
+from day02.id_index import IdIndex, index_path, open_index, solve_doubled, solve_repeated
+
+# small enough to build in a moment, large enough for ranges on both sides
+MAX_DIGITS = 6
+
+
+class TestIdIndex(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        environment = mock.patch.dict(os.environ, {"AOC_INDEX_DIR": directory.name})
+        environment.start()
+        self.addCleanup(environment.stop)
+        open_index.cache_clear()
+        self.addCleanup(open_index.cache_clear)
+
+    def test_matches_baseline(self):
+        """Ranges inside the index and ranges past it, which fall back."""
+        rng = random.Random(16)
+        for _ in range(50):
+            lower = rng.randrange(1, 10 ** rng.randrange(1, MAX_DIGITS + 2))
+            ranges = [(lower, lower + rng.randrange(0, 3000))]
+            with self.subTest(ranges=ranges):
+                self.assertEqual(solve_doubled(ranges, MAX_DIGITS), part01.solve(ranges))
+                self.assertEqual(solve_repeated(ranges, MAX_DIGITS), part02.solve(ranges))
+
+    def test_built_on_first_use(self):
+        path = index_path(MAX_DIGITS)
+        self.assertFalse(path.exists())
+        solve_doubled([(11, 22)], MAX_DIGITS)
+        self.assertTrue(path.exists())
+
+    def test_load_matches_build(self):
+        built = IdIndex.build(MAX_DIGITS)
+        path = index_path(MAX_DIGITS)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        built.save(path)
+        loaded = IdIndex.load(path)
+        self.assertEqual(loaded.max_digits, MAX_DIGITS)
+        for rule in ("doubled", "repeated"):
+            with self.subTest(rule=rule):
+                self.assertEqual(list(getattr(loaded, rule).ids), list(getattr(built, rule).ids))
+                self.assertEqual(
+                    list(getattr(loaded, rule).prefix_sums),
+                    list(getattr(built, rule).prefix_sums),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
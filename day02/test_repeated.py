@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from day02 import part01, part02
+from day02.repeated import (
+    doubled_ids,
+    repeated_ids,
+    solve_doubled,
+    solve_repeated,
+    sum_doubled_ids,
+    sum_repeated_ids,
+)
+
+
+def random_range(rng, max_digits):
+    lower = rng.randrange(1, 10**max_digits)
+    return lower, lower + rng.randrange(0, 3000)
+
+
+class TestMatchesBaseline(unittest.TestCase):
+    def assert_same(self, lower, upper):
+        doubled = list(part01.invalid_ids(lower, upper))
+        repeated = list(part02.invalid_ids(lower, upper))
+        self.assertEqual(list(doubled_ids(lower, upper)), doubled)
+        self.assertEqual(list(repeated_ids(lower, upper)), repeated)
+        self.assertEqual(sum_doubled_ids(lower, upper), sum(doubled))
+        self.assertEqual(sum_repeated_ids(lower, upper), sum(repeated))
+
+    def test_random_ranges(self):
+        rng = random.Random(15)
+        for _ in range(200):
+            lower, upper = random_range(rng, rng.randrange(1, 9))
+            with self.subTest(lower=lower, upper=upper):
+                self.assert_same(lower, upper)
+
+    def test_ranges_across_powers_of_ten(self):
+        """Ranges that start below and end above 10**k, for every length."""
+        rng = random.Random(10)
+        for power in range(1, 8):
+            for _ in range(5):
+                lower = max(1, 10**power - rng.randrange(1, 2000))
+                upper = 10**power + rng.randrange(0, 2000)
+                with self.subTest(lower=lower, upper=upper):
+                    self.assert_same(lower, upper)
+
+    def test_single_id_ranges(self):
+        for n in (1, 9, 11, 99, 111, 1010, 1111, 123123, 222222, 1212121212):
+            with self.subTest(n=n):
+                self.assert_same(n, n)
+
+    def test_blocks_counted_once(self):
+        """222222 repeats blocks 2, 22 and 222 but is one invalid ID."""
+        self.assertEqual(sum_repeated_ids(222222, 222222), 222222)
+        self.assertEqual(sum_doubled_ids(222222, 222222), 222222)
+        self.assertEqual(sum_repeated_ids(2222222, 2222222), 2222222)
+        self.assertEqual(sum_doubled_ids(2222222, 2222222), 0)
+
+    def test_solvers_match_on_many_ranges(self):
+        rng = random.Random(2)
+        ranges = [random_range(rng, 7) for _ in range(30)]
+        self.assertEqual(solve_doubled(ranges), part01.solve(ranges))
+        self.assertEqual(solve_repeated(ranges), part02.solve(ranges))
+
+
+if __name__ == "__main__":
+    unittest.main()
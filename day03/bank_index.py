@@ -0,0 +1,104 @@
+"""
+Sparse-table range-maximum index over a battery bank.
+
+Each position is keyed as ``digit * n + (n - 1 - position)``, so the largest
+key in a window is its largest digit at its leftmost position. Level ``j``
+of the table holds the largest key of every window of ``2**j`` positions,
+and any window is covered by two overlapping power-of-two windows, which
+makes "leftmost max in ``[start, stop)``" two lookups. A ``k``-digit
+joltage over any sub-window is then ``k`` such queries.
+
+The index is built once per bank in O(n log n) and pickles, so
+``index_banks`` caches it with the rest of the solver artifacts.
+"""
+
+from array import array
+
+from aoc.cache import artifact
+from aoc.input import Source, decode_digits, open_input, source_from_argv
+from day03.joltage import Battery, BatteryBank
+
+
+class BankIndex:
+    def __init__(self, battery_bank: BatteryBank) -> None:
+        self.bank = bytes(battery_bank)
+        size = len(self.bank)
+        level = array("q", (digit * size + size - 1 - i for i, digit in enumerate(self.bank)))
+        self.levels = [level]
+
+        width = 1
+        while width * 2 <= size:
+            level = array("q", map(max, level[: size - width * 2 + 1], level[width:]))
+            self.levels.append(level)
+            width *= 2
+
+    def __len__(self) -> int:
+        return len(self.bank)
+
+    def leftmost_max(self, start: int, stop: int) -> int:
+        """
+        Position of the first largest digit in ``[start, stop)``.
+
+        >>> BankIndex([8, 1, 9, 1, 9, 2]).leftmost_max(0, 6)
+        2
+        >>> BankIndex([8, 1, 9, 1, 9, 2]).leftmost_max(3, 6)
+        4
+        """
+        if not 0 <= start < stop <= len(self.bank):
+            raise ValueError(f"Empty or out of range window [{start}, {stop})")
+
+        level = (stop - start).bit_length() - 1
+        table = self.levels[level]
+        key = max(table[start], table[stop - (1 << level)])
+        return len(self.bank) - 1 - key % len(self.bank)
+
+    def max_joltage(self, k: int, start: int = 0, stop: int | None = None) -> int:
+        """
+        The largest ``k``-digit joltage using only positions ``[start, stop)``.
+
+        >>> index = BankIndex([8, 1, 8, 1, 8, 1, 9, 1, 1, 1, 1, 2, 1, 1, 1])
+        >>> index.max_joltage(12), index.max_joltage(2), index.max_joltage(3, 7, 12)
+        (888911112111, 92, 112)
+        """
+        stop = len(self.bank) if stop is None else stop
+        if not 0 < k <= stop - start:
+            raise ValueError(f"Cannot pick {k} digits from positions [{start}, {stop})")
+
+        joltage = 0
+        for digits_left in range(k - 1, -1, -1):
+            position = self.leftmost_max(start, stop - digits_left)
+            joltage = joltage * 10 + self.bank[position]
+            start = position + 1
+        return joltage
+
+
+@artifact("day03.bank_indexes")
+def index_banks(battery: Battery) -> list[BankIndex]:
+    return [BankIndex(battery_bank) for battery_bank in battery]
+
+
+def parse_input(source: Source = None) -> Battery:
+    with open_input(source) as data:
+        return decode_digits(data)
+
+
+def count_joltage(battery: Battery, k: int) -> int:
+    return sum(index.max_joltage(k) for index in index_banks(battery))
+
+
+def solve_two(battery: Battery) -> int:
+    return count_joltage(battery, 2)
+
+
+def solve_twelve(battery: Battery) -> int:
+    return count_joltage(battery, 12)
+
+
+def main() -> None:
+    battery = parse_input(source_from_argv())
+    print(solve_two(battery))
+    print(solve_twelve(battery))
+
+
+if __name__ == "__main__":
+    main()
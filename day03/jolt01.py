@@ -1,49 +1,27 @@
-import sys
-
-type BatteryBank = list[int]
-type Battery = list[BatteryBank]
-
-
-def max_with_index(values: list[int]) -> tuple[int, int]:
-    try:
-        max_value = values[0]
-        max_index = 0
-
-        for index, value in enumerate(values[1:], start=1):
-            if value > max_value:
-                max_value = value
-                max_index = index
-
-        return max_value, max_index
-    except IndexError as e:
-        raise ValueError("Cannot find max of empty list") from e
+from aoc.input import Source, decode_digits, open_input, source_from_argv
+from day03.joltage import Battery, BatteryBank, max_joltage
 
 
 def find_max_joltage(battery_bank: BatteryBank) -> int:
-    first_digit, first_index = max_with_index(battery_bank[:-1])
-    battery_bank = battery_bank[first_index + 1 :]
-    second_digit, _ = max_with_index(battery_bank)
-
-    return first_digit * 10 + second_digit
+    return max_joltage(battery_bank, 2)
 
 
 def count_joltage(battery: Battery) -> int:
     return sum(find_max_joltage(battery_bank) for battery_bank in battery)
 
 
-def parse_input() -> Battery:
-    if len(sys.argv) > 1:
-        with open(sys.argv[1], "r", encoding="utf-8") as file:
-            lines = file.readlines()
-    else:
-        lines = sys.stdin.readlines()
+def parse_input(source: Source = None) -> Battery:
+    with open_input(source) as data:
+        return decode_digits(data)
+
 
-    return [[int(digit) for digit in line.strip()] for line in lines]
+def solve(battery: Battery) -> int:
+    return count_joltage(battery)
 
 
 def main() -> None:
-    lines = parse_input()
-    result = count_joltage(lines)
+    lines = parse_input(source_from_argv())
+    result = solve(lines)
     print(result)
 
 
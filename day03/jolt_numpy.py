@@ -0,0 +1,106 @@
+"""
+Vectorized engine for both parts of day 3.
+
+Banks of equal length are read straight from the input bytes as one 2D
+uint8 array, and every digit of the joltage is picked for all banks at once
+with an argmax over a window that starts after each bank's previous pick.
+``argmax`` returns the first maximum, the same leftmost choice the scalar
+solvers make. Inputs with banks of different lengths fall back to the
+per-bank stack in ``day03.joltage``.
+"""
+
+import numpy as np
+
+from aoc.input import Buffer, Source, decode_digits, open_input, source_from_argv
+from day03.joltage import max_joltage
+
+# digits handled per step, bounding the temporary window arrays
+BATCH_CELLS = 1 << 22
+
+type Banks = np.ndarray | list[bytes]
+
+
+def decode_banks(data: Buffer) -> Banks:
+    """
+    >>> decode_banks(b"987\\n811\\n").tolist()
+    [[9, 8, 7], [8, 1, 1]]
+    >>> decode_banks(b"987\\n81\\n")
+    [b'\\t\\x08\\x07', b'\\x08\\x01']
+    """
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    if buffer.size and buffer[-1] != ord("\n"):
+        buffer = np.append(buffer, np.uint8(ord("\n")))
+
+    newlines = np.flatnonzero(buffer == ord("\n"))
+    width = int(newlines[0]) if newlines.size else 0
+    stride = width + 1
+    if width == 0 or buffer.size != newlines.size * stride:
+        return decode_digits(data)
+
+    rows = buffer.reshape(-1, stride)
+    if buffer[width - 1] == ord("\r"):
+        width -= 1
+    terminator = np.frombuffer(data[width:stride], dtype=np.uint8)
+    digits = rows[:, :width] - ord("0")
+    if (digits > 9).any() or (rows[:, width:] != terminator).any():
+        return decode_digits(data)
+    return digits
+
+
+def max_joltages(digits: np.ndarray, k: int) -> np.ndarray:
+    """
+    The ``k``-digit joltage of every row of ``digits``.
+
+    >>> max_joltages(decode_banks(b"987654321111111\\n818181911112111\\n"), 12)
+    array([987654321111, 888911112111])
+    """
+    rows, width = digits.shape
+    if not 0 < k <= min(width, 18):
+        raise ValueError(f"Cannot pick {k} digits from banks of {width}")
+
+    row_index = np.arange(rows)
+    columns = np.arange(width)
+    joltages = np.zeros(rows, dtype=np.int64)
+    last = np.full(rows, -1)
+
+    for digit_i in range(k):
+        end = width - k + digit_i + 1
+        window = np.where(columns[:end] > last[:, None], digits[:, :end], np.int8(-1))
+        last = window.argmax(axis=1)
+        joltages = joltages * 10 + digits[row_index, last]
+
+    return joltages
+
+
+def count_joltage(banks: Banks, k: int) -> int:
+    if isinstance(banks, list):
+        return sum(max_joltage(bank, k) for bank in banks)
+
+    rows = max(1, BATCH_CELLS // max(1, banks.shape[1]))
+    return sum(
+        int(max_joltages(banks[start : start + rows], k).sum())
+        for start in range(0, len(banks), rows)
+    )
+
+
+def parse_input(source: Source = None) -> Banks:
+    with open_input(source) as data:
+        return decode_banks(data)
+
+
+def solve_two(banks: Banks) -> int:
+    return count_joltage(banks, 2)
+
+
+def solve_twelve(banks: Banks) -> int:
+    return count_joltage(banks, 12)
+
+
+def main() -> None:
+    banks = parse_input(source_from_argv())
+    print(solve_two(banks))
+    print(solve_twelve(banks))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Greedy monotonic-stack selection of the largest ``k``-digit joltage.
+
+Walking the bank once, a digit evicts smaller digits before it while there
+are still digits to spare, so the stack holds the best subsequence seen so
+far. The bank is only read, never sliced.
+"""
+
+from collections.abc import Sequence
+
+type BatteryBank = Sequence[int]
+type Battery = Sequence[BatteryBank]
+
+
+def max_joltage(battery_bank: BatteryBank, k: int) -> int:
+    """
+    >>> max_joltage([9, 8, 7, 6, 5, 4, 3, 2, 1, 1, 1, 1, 1, 1, 1], 2)
+    98
+    >>> max_joltage([8, 1, 8, 1, 8, 1, 9, 1, 1, 1, 1, 2, 1, 1, 1], 12)
+    888911112111
+    """
+    spare = len(battery_bank) - k
+    if spare < 0 or k <= 0:
+        raise ValueError(f"Cannot pick {k} digits from a bank of {len(battery_bank)}")
+
+    # the sentinel outranks every digit, so the loop never checks for empty
+    stack = bytearray(b"\x0a")
+    pop, push = stack.pop, stack.append
+    for digit in battery_bank:
+        while stack[-1] < digit and spare:
+            pop()
+            spare -= 1
+        push(digit)
+
+    joltage = 0
+    for index in range(1, k + 1):
+        joltage = joltage * 10 + stack[index]
+    return joltage
@@ -0,0 +1,41 @@
+import random
+import unittest
+
+from day03.bank_index import BankIndex
+from day03.joltage import max_joltage
+
+
+class TestBankIndex(unittest.TestCase):
+    def test_leftmost_max_of_every_window(self):
+        rng = random.Random(20)
+        for _ in range(50):
+            bank = [rng.randrange(1, 10) for _ in range(rng.randrange(1, 40))]
+            index = BankIndex(bank)
+            for start in range(len(bank)):
+                for stop in range(start + 1, len(bank) + 1):
+                    window = bank[start:stop]
+                    expected = start + window.index(max(window))
+                    self.assertEqual(index.leftmost_max(start, stop), expected)
+
+    def test_matches_stack_on_windows(self):
+        rng = random.Random(2)
+        for _ in range(200):
+            bank = [rng.randrange(1, 10) for _ in range(rng.randrange(1, 30))]
+            start = rng.randrange(len(bank))
+            stop = rng.randrange(start + 1, len(bank) + 1)
+            k = rng.randrange(1, stop - start + 1)
+            with self.subTest(bank=bank, k=k, start=start, stop=stop):
+                self.assertEqual(
+                    BankIndex(bank).max_joltage(k, start, stop),
+                    max_joltage(bank[start:stop], k),
+                )
+
+    def test_rejects_empty_windows(self):
+        with self.assertRaises(ValueError):
+            BankIndex([1, 2, 3]).leftmost_max(2, 2)
+        with self.assertRaises(ValueError):
+            BankIndex([1, 2, 3]).max_joltage(3, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import random
+import unittest
+from importlib.util import find_spec
+from unittest import mock
+
+from day03 import jolt01, jolt02
+
+# numpy is optional, like the engine under test
+HAS_NUMPY = find_spec("numpy") is not None
+if HAS_NUMPY:
+    from day03 import jolt_numpy
+
+
+def random_banks(rng, rows, width):
+    return "".join(
+        "".join(rng.choice("123456789") for _ in range(width)) + "\n" for _ in range(rows)
+    ).encode()
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+class TestJoltNumpy(unittest.TestCase):
+    def assert_same(self, data):
+        banks = jolt_numpy.decode_banks(data)
+        battery = jolt01.parse_input(data)
+        self.assertEqual(jolt_numpy.solve_two(banks), jolt01.solve(battery))
+        self.assertEqual(jolt_numpy.solve_twelve(banks), jolt02.solve(battery))
+
+    def test_matches_reference(self):
+        rng = random.Random(19)
+        for _ in range(30):
+            data = random_banks(rng, rng.randrange(1, 50), rng.randrange(12, 40))
+            with self.subTest(data=data):
+                self.assert_same(data)
+
+    def test_batches_split_rows(self):
+        """Batches smaller than one row still take a whole row at a time."""
+        data = random_banks(random.Random(3), 25, 20)
+        for cells in (1, 45, 1 << 22):
+            with self.subTest(cells=cells), mock.patch.object(jolt_numpy, "BATCH_CELLS", cells):
+                self.assert_same(data)
+
+    def test_ragged_and_crlf_input(self):
+        """Input the array path cannot take falls back to the byte rows."""
+        self.assert_same(b"987654321111111\n81818191111211\n")
+        self.assert_same(b"987654321111111\r\n818181911112111\r\n")
+        self.assert_same(b"987654321111111\n818181911112111")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import random
+import unittest
+from itertools import combinations
+
+from day03.joltage import max_joltage
+
+
+def brute_force_joltage(battery_bank, k):
+    return max(
+        int("".join(map(str, digits))) for digits in combinations(battery_bank, k)
+    )
+
+
+class TestMaxJoltage(unittest.TestCase):
+    def test_matches_brute_force(self):
+        rng = random.Random(18)
+        for _ in range(300):
+            battery_bank = [rng.randrange(1, 10) for _ in range(rng.randrange(1, 14))]
+            k = rng.randrange(1, len(battery_bank) + 1)
+            with self.subTest(battery_bank=battery_bank, k=k):
+                self.assertEqual(
+                    max_joltage(battery_bank, k), brute_force_joltage(battery_bank, k)
+                )
+
+    def test_equal_digits(self):
+        self.assertEqual(max_joltage([5] * 15, 12), 555555555555)
+
+    def test_whole_bank(self):
+        self.assertEqual(max_joltage([1, 2, 3], 3), 123)
+
+    def test_too_many_digits(self):
+        with self.assertRaises(ValueError):
+            max_joltage([1, 2], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Vectorized engine for day 4 part 1.
+
+The grid becomes a boolean roll mask with a one-cell empty border, and the
+number of rolls around every cell is a 3x3 sliding-window sum of that mask
+minus the cell itself. The window sum is separable: three shifted column
+views are added, then three shifted row views of the result, all on uint8
+views of the same buffer. Rows are processed in bands so the temporaries
+stay bounded on very large grids.
+"""
+
+import numpy as np
+
+from aoc.grid import PaddedGrid
+from aoc.input import Source, open_input, source_from_argv
+
+ROLL = ord("@")
+
+# the puzzle rule: a roll is accessible with fewer neighbors than this
+THRESHOLD = 4
+
+# rows handled per step, bounding the temporary window arrays
+BAND_ROWS = 1 << 10
+
+
+def roll_mask(grid: PaddedGrid) -> np.ndarray:
+    """Rolls of ``grid`` with exactly one empty cell of border, as uint8."""
+    if grid.pad < 1:
+        raise ValueError("The grid needs at least one cell of padding")
+
+    padded = grid.view(padded=True)
+    first = grid.pad - 1
+    bordered = padded[first : first + grid.height + 2, first : first + grid.width + 2]
+    return (bordered == ROLL).view(np.uint8)
+
+
+def neighbor_counts(mask: np.ndarray) -> np.ndarray:
+    """
+    Rolls among the 8 neighbors of every cell inside the border of ``mask``.
+
+    >>> neighbor_counts(roll_mask(PaddedGrid.from_rows(["@@.", "@@@"])))
+    array([[3, 4, 3],
+           [3, 4, 2]], dtype=uint8)
+    """
+    columns = mask[:, :-2] + mask[:, 1:-1] + mask[:, 2:]
+    window = columns[:-2] + columns[1:-1] + columns[2:]
+    window -= mask[1:-1, 1:-1]
+    return window
+
+
+def count_accessible(grid: PaddedGrid, threshold: int = THRESHOLD) -> int:
+    """
+    Rolls with fewer than ``threshold`` rolls around them.
+
+    >>> grid = PaddedGrid.from_rows(["@@.", "@@@"])
+    >>> count_accessible(grid), count_accessible(grid, 5)
+    (3, 5)
+    """
+    return count_accessible_rows(roll_mask(grid), threshold)
+
+
+def count_accessible_rows(mask: np.ndarray, threshold: int = THRESHOLD) -> int:
+    """
+    Accessible rolls in the rows of ``mask`` strictly inside its first and
+    last row, which are only read as neighbors.
+    """
+    count = 0
+    for start in range(0, mask.shape[0] - 2, BAND_ROWS):
+        band = mask[start : start + BAND_ROWS + 2]
+        accessible = neighbor_counts(band) < threshold
+        accessible &= band[1:-1, 1:-1].view(bool)
+        count += int(np.count_nonzero(accessible))
+    return count
+
+
+def parse_input(source: Source = None) -> PaddedGrid:
+    with open_input(source) as data:
+        return PaddedGrid.decode(data)
+
+
+def solve(grid: PaddedGrid, threshold: int = THRESHOLD) -> int:
+    return count_accessible(grid, threshold)
+
+
+def main() -> None:
+    grid = parse_input(source_from_argv())
+    print(solve(grid))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Peeling engine for day 4 part 2.
+
+The rolls that are never removed are exactly those of the largest set in
+which every roll keeps at least ``threshold`` rolls around it (the k-core of
+the neighbor graph), so the removal order does not matter. Every roll's
+neighbor count is computed once into a byte array; removing a roll
+decrements its neighbors, and a roll is queued once, at the moment its count
+drops below the threshold. Every roll is visited a bounded number of times.
+"""
+
+from aoc import instrument
+from aoc.grid import PaddedGrid
+from aoc.input import Source, open_input, source_from_argv
+
+ROLL = ord("@")
+REMOVED = ord("X")
+
+# the puzzle rule: a roll is accessible with fewer neighbors than this
+THRESHOLD = 4
+
+
+def count_removable_rolls(grid: PaddedGrid, threshold: int = THRESHOLD) -> int:
+    """
+    >>> grid = PaddedGrid.from_rows(["@@@@", "@@@@", "@@@@", "@@@."])
+    >>> count_removable_rolls(grid), count_removable_rolls(grid, 5)
+    (3, 15)
+    """
+    # solvers must not mutate their parsed input
+    grid = grid.copy()
+    cells = grid.cells
+    offsets = grid.offsets
+
+    with instrument.span("count neighbors"):
+        counts = grid.neighbor_counts(ROLL)
+
+    # only mark the first removals once every count is taken
+    queue = [
+        index
+        for index in grid.indices()
+        if cells[index] == ROLL and counts[index] < threshold
+    ]
+    for index in queue:
+        cells[index] = REMOVED
+
+    removed = len(queue)
+    with instrument.span("peel rolls"):
+        pop, push = queue.pop, queue.append
+        while queue:
+            index = pop()
+            for offset in offsets:
+                neighbor = index + offset
+                if cells[neighbor] != ROLL:
+                    continue
+                count = counts[neighbor] - 1
+                counts[neighbor] = count
+                if count < threshold:
+                    cells[neighbor] = REMOVED
+                    push(neighbor)
+                    removed += 1
+
+    instrument.count("rolls_peel.removed", removed)
+    return removed
+
+
+def parse_input(source: Source = None) -> PaddedGrid:
+    with open_input(source) as data:
+        return PaddedGrid.decode(data)
+
+
+def solve(grid: PaddedGrid, threshold: int = THRESHOLD) -> int:
+    return count_removable_rolls(grid, threshold)
+
+
+def main() -> None:
+    grid = parse_input(source_from_argv())
+    print(solve(grid))
+
+
+if __name__ == "__main__":
+    main()
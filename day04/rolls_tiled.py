@@ -0,0 +1,198 @@
+"""
+Multi-process engine for both parts of day 4 on row bands in shared memory.
+
+The grid is cut into bands of whole rows, each stored as a roll mask in its
+own ``multiprocessing.shared_memory`` block together with one halo row above
+and below: a copy of the neighboring band's edge row, or the empty border.
+Workers attach to one band at a time, and bands are sized so that peeling
+one stays within ``WORKER_MEMORY``.
+
+Part 1 needs a single pass over every band. For part 2 every band is peeled
+in its worker with ``day04.rolls_waves`` while its halo rows stay fixed, then
+the edge rows are copied into the neighbors' halos and only the bands whose
+halo changed are peeled again, until no band changes. A stale halo only
+holds rolls its owner has since removed, so a band never removes a roll the
+sequential solvers would keep, and the last round runs on current halos.
+"""
+
+import math
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import pairwise
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from aoc import instrument
+from aoc.grid import PaddedGrid
+from aoc.input import Source, open_input, source_from_argv
+from day04.rolls_numpy import ROLL, THRESHOLD, count_accessible_rows
+from day04.rolls_waves import PEAK_BYTES_PER_CELL, peel_in_waves
+
+# memory one worker may use for the band it peels
+WORKER_MEMORY = 512 << 20
+# cells per band; a band is never narrower than one row, however wide
+BAND_SIZE = WORKER_MEMORY // PEAK_BYTES_PER_CELL
+
+
+class Band:
+    """A band's shared block and its mask, with the halo as first and last row."""
+
+    def __init__(self, memory: SharedMemory, rows: int, stride: int) -> None:
+        self.memory = memory
+        self.rows = rows
+        self.stride = stride
+        self.mask = np.ndarray((rows + 2, stride), dtype=np.uint8, buffer=memory.buf)
+
+    @classmethod
+    def attach(cls, name: str, rows: int, stride: int) -> "Band":
+        return cls(SharedMemory(name=name), rows, stride)
+
+    def close(self) -> None:
+        # the block cannot be unmapped while the array still exports it
+        del self.mask
+        self.memory.close()
+
+
+def split_rows(height: int, bands: int) -> list[tuple[int, int]]:
+    """
+    >>> split_rows(10, 3)
+    [(0, 3), (3, 6), (6, 10)]
+    """
+    bands = max(1, min(bands, height))
+    return [(height * i // bands, height * (i + 1) // bands) for i in range(bands)]
+
+
+@contextmanager
+def shared_bands(grid: PaddedGrid, bands: int) -> Iterator[list[Band]]:
+    """Copy the rolls of ``grid`` into ``bands`` shared row bands, halos included."""
+    if grid.pad < 1:
+        raise ValueError("The grid needs at least one cell of padding")
+
+    padded = grid.view(padded=True)
+    first = grid.pad - 1
+    bordered = padded[first : first + grid.height + 2, first : first + grid.width + 2]
+    stride = grid.width + 2
+
+    created: list[Band] = []
+    try:
+        for start, stop in split_rows(grid.height, bands):
+            rows = stop - start
+            memory = SharedMemory(create=True, size=(rows + 2) * stride)
+            band = Band(memory, rows, stride)
+            created.append(band)
+            np.equal(bordered[start : stop + 2], ROLL, out=band.mask.view(bool))
+        yield created
+    finally:
+        for band in created:
+            band.close()
+            band.memory.unlink()
+
+
+def exchange_halos(bands: list[Band]) -> set[int]:
+    """Copy every band's edge rows into its neighbors' halos; return whose changed."""
+    changed = set()
+    for i, (upper, lower) in enumerate(pairwise(bands)):
+        if not np.array_equal(upper.mask[-1], lower.mask[1]):
+            upper.mask[-1] = lower.mask[1]
+            changed.add(i)
+        if not np.array_equal(lower.mask[0], upper.mask[-2]):
+            lower.mask[0] = upper.mask[-2]
+            changed.add(i + 1)
+    return changed
+
+
+def _count_band(name: str, rows: int, stride: int, threshold: int) -> int:
+    band = Band.attach(name, rows, stride)
+    try:
+        return count_accessible_rows(band.mask, threshold)
+    finally:
+        band.close()
+
+
+def _peel_band(name: str, rows: int, stride: int, threshold: int) -> int:
+    band = Band.attach(name, rows, stride)
+    try:
+        return sum(peel_in_waves(band.mask, threshold))
+    finally:
+        band.close()
+
+
+def _map_bands(
+    pool: Executor | None,
+    task: Callable[[str, int, int, int], int],
+    bands: list[Band],
+    threshold: int,
+) -> list[int]:
+    arguments = [(band.memory.name, band.rows, band.stride, threshold) for band in bands]
+    if pool is None:
+        return [task(*args) for args in arguments]
+    futures = [pool.submit(task, *args) for args in arguments]
+    return [future.result() for future in futures]
+
+
+@contextmanager
+def _worker_pool(workers: int) -> Iterator[Executor | None]:
+    if workers == 1:
+        yield None
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield pool
+
+
+def band_count(grid: PaddedGrid, workers: int) -> int:
+    return max(workers, math.ceil(grid.height * (grid.width + 2) / BAND_SIZE))
+
+
+def count_accessible(
+    grid: PaddedGrid, threshold: int = THRESHOLD, workers: int | None = None
+) -> int:
+    workers = workers or os.cpu_count() or 1
+    with shared_bands(grid, band_count(grid, workers)) as bands, _worker_pool(workers) as pool:
+        return sum(_map_bands(pool, _count_band, bands, threshold))
+
+
+def count_removable(
+    grid: PaddedGrid, threshold: int = THRESHOLD, workers: int | None = None
+) -> int:
+    workers = workers or os.cpu_count() or 1
+    with shared_bands(grid, band_count(grid, workers)) as bands, _worker_pool(workers) as pool:
+        total = 0
+        rounds = 0
+        dirty = list(range(len(bands)))
+        while dirty:
+            rounds += 1
+            total += sum(_map_bands(pool, _peel_band, [bands[i] for i in dirty], threshold))
+            dirty = sorted(exchange_halos(bands))
+
+    instrument.count("rolls_tiled.rounds", rounds)
+    return total
+
+
+def parse_input(source: Source = None) -> PaddedGrid:
+    with open_input(source) as data:
+        return PaddedGrid.decode(data)
+
+
+def solve_accessible(
+    grid: PaddedGrid, threshold: int = THRESHOLD, workers: int | None = None
+) -> int:
+    return count_accessible(grid, threshold, workers)
+
+
+def solve_removable(
+    grid: PaddedGrid, threshold: int = THRESHOLD, workers: int | None = None
+) -> int:
+    return count_removable(grid, threshold, workers)
+
+
+def main() -> None:
+    grid = parse_input(source_from_argv())
+    print(solve_accessible(grid))
+    print(solve_removable(grid))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Wave-synchronous vectorized engine for day 4 part 2.
+
+Every wave removes all rolls that are accessible at its start. Neighbor
+counts are taken once for the whole grid with the window sum of
+``day04.rolls_numpy``; after that a wave only touches the cells around the
+previous wave's removals: their remaining roll neighbors get their counts
+decremented and are the only candidates for the next wave. Cells are
+addressed by flat index into the bordered grid, so the neighbors of a
+chunk of removals are one broadcast addition.
+
+Besides the mask and the counts, one byte per cell each, memory grows with
+the size of a wave: four bytes per removed roll and per candidate, plus
+temporaries for at most ``CHUNK_ROLLS`` removals at a time. The measured
+peak, mask included, stays below 8 bytes per cell even when every other
+cell goes in the first wave; ``PEAK_BYTES_PER_CELL`` adds headroom to that.
+
+Removing rolls in waves ends with the same rolls left as removing them one
+by one, so the total matches ``day04.rolls02``.
+
+    python -m day04.rolls_waves input.txt
+"""
+
+import numpy as np
+
+from aoc import instrument
+from aoc.grid import PaddedGrid
+from aoc.input import Source, open_input, source_from_argv
+from day04.rolls_numpy import BAND_ROWS, THRESHOLD, neighbor_counts, roll_mask
+
+# removals whose neighbors are expanded at once, bounding the int temporaries
+CHUNK_ROLLS = 1 << 18
+
+# upper bound on what peel_in_waves holds per cell of its mask, mask included
+PEAK_BYTES_PER_CELL = 12
+
+
+def _sorted_runs(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """The distinct values of a sorted array and how often each appears."""
+    first = np.empty(values.size, dtype=bool)
+    first[:1] = True
+    np.not_equal(values[1:], values[:-1], out=first[1:])
+    starts = np.flatnonzero(first)
+    return values[starts], np.diff(starts, append=values.size)
+
+
+def peel_in_waves(mask: np.ndarray, threshold: int = THRESHOLD) -> list[int]:
+    """
+    Remove accessible rolls from a ``roll_mask`` in place, wave by wave, and
+    return how many every wave removed.
+
+    Only rows strictly inside the first and last row change. Those two rows
+    are read as neighbors but kept, so a band of a larger grid can be peeled
+    with its neighbors' edge rows as halo; the outer columns must be empty.
+    """
+    rows, stride = mask.shape
+    rolls = mask.ravel()
+    counts = np.zeros_like(mask)
+    for start in range(0, rows - 2, BAND_ROWS):
+        band = mask[start : start + BAND_ROWS + 2]
+        counts[start + 1 : start + band.shape[0] - 1, 1:-1] = neighbor_counts(band)
+    counts = counts.ravel()
+
+    index_type = np.dtype(np.int32 if rolls.size <= np.iinfo(np.int32).max else np.int64)
+    offsets = np.array(
+        [-stride - 1, -stride, -stride + 1, -1, 1, stride - 1, stride, stride + 1],
+        dtype=index_type,
+    )
+    # the empty outer columns keep every neighbor index inside the mask
+    first_inner, last_inner = stride, rolls.size - stride
+
+    waves = []
+    first_wave = []
+    band_size = BAND_ROWS * stride
+    for start in range(first_inner, last_inner, band_size):
+        stop = min(start + band_size, last_inner)
+        accessible = (counts[start:stop] < threshold) & (rolls[start:stop] == 1)
+        # a Python int keeps the int32 dtype, and every index fits in it
+        first_wave.append(np.flatnonzero(accessible).astype(index_type) + start)
+    removed = np.concatenate(first_wave) if first_wave else np.empty(0, dtype=index_type)
+    del first_wave
+    while removed.size:
+        waves.append(int(removed.size))
+        rolls[removed] = 0
+
+        parts = []
+        for start in range(0, removed.size, CHUNK_ROLLS):
+            chunk = removed[start : start + CHUNK_ROLLS]
+            neighbors = (chunk[:, None] + offsets).ravel()
+            neighbors = neighbors[(neighbors >= first_inner) & (neighbors < last_inner)]
+            neighbors = neighbors[rolls[neighbors] == 1]
+            neighbors.sort()
+
+            # a roll next to several removed rolls appears once per removal
+            touched, removals = _sorted_runs(neighbors)
+            del neighbors
+            counts[touched] -= removals.astype(np.uint8)
+            parts.append(touched)
+
+        candidates = np.concatenate(parts)
+        if len(parts) > 1:
+            # chunks can share neighbors
+            candidates.sort()
+            candidates, _ = _sorted_runs(candidates)
+        del parts
+        removed = candidates[counts[candidates] < threshold]
+        del candidates
+
+    return waves
+
+
+def remove_in_waves(grid: PaddedGrid, threshold: int = THRESHOLD) -> tuple[list[int], int]:
+    """
+    Rolls removed by every wave, and their total.
+
+    >>> remove_in_waves(PaddedGrid.from_rows(["@@@@", "@@@@", "@@@@", "@@@."]), 5)
+    ([5, 6, 4], 15)
+    """
+    waves = peel_in_waves(roll_mask(grid), threshold)
+    instrument.count("rolls_waves.waves", len(waves))
+    return waves, sum(waves)
+
+
+def parse_input(source: Source = None) -> PaddedGrid:
+    with open_input(source) as data:
+        return PaddedGrid.decode(data)
+
+
+def solve(grid: PaddedGrid, threshold: int = THRESHOLD) -> int:
+    _, total = remove_in_waves(grid, threshold)
+    return total
+
+
+def main() -> None:
+    grid = parse_input(source_from_argv())
+    waves, total = remove_in_waves(grid)
+    for wave, removed in enumerate(waves, 1):
+        print(f"wave {wave}: {removed}")
+    print(total)
+
+
+if __name__ == "__main__":
+    main()
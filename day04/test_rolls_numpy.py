@@ -0,0 +1,48 @@
+import random
+import unittest
+from importlib.util import find_spec
+from unittest import mock
+
+from aoc.grid import PaddedGrid
+from day04 import rolls01
+
+# numpy is optional, like the engine under test
+HAS_NUMPY = find_spec("numpy") is not None
+if HAS_NUMPY:
+    from day04 import rolls_numpy
+
+
+def random_grid(rng, width, height):
+    return PaddedGrid.from_rows(
+        "".join(rng.choice(".@@@") for _ in range(width)) for _ in range(height)
+    )
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+class TestRollsNumpy(unittest.TestCase):
+    def test_matches_reference(self):
+        rng = random.Random(22)
+        for _ in range(50):
+            grid = random_grid(rng, rng.randrange(1, 20), rng.randrange(1, 20))
+            with self.subTest(grid=str(grid)):
+                self.assertEqual(
+                    rolls_numpy.count_accessible(grid), rolls01.count_fork_accessible_rolls(grid)
+                )
+
+    def test_bands_split_rows(self):
+        grid = random_grid(random.Random(5), 13, 31)
+        expected = rolls01.count_fork_accessible_rolls(grid)
+        for rows in (1, 2, 7, 1 << 10):
+            with self.subTest(rows=rows), mock.patch.object(rolls_numpy, "BAND_ROWS", rows):
+                self.assertEqual(rolls_numpy.count_accessible(grid), expected)
+
+    def test_wider_padding(self):
+        rows = ["@@.", "@@@", ".@@"]
+        self.assertEqual(
+            rolls_numpy.count_accessible(PaddedGrid.from_rows(rows, pad=3)),
+            rolls_numpy.count_accessible(PaddedGrid.from_rows(rows)),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
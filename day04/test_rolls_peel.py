@@ -0,0 +1,30 @@
+import random
+import unittest
+
+from aoc.grid import PaddedGrid
+from day04 import rolls02
+from day04.rolls_peel import count_removable_rolls
+
+
+class TestRollsPeel(unittest.TestCase):
+    def test_matches_reference(self):
+        rng = random.Random(23)
+        for _ in range(50):
+            width, height = rng.randrange(1, 20), rng.randrange(1, 20)
+            grid = PaddedGrid.from_rows(
+                "".join(rng.choice(".@@@") for _ in range(width)) for _ in range(height)
+            )
+            with self.subTest(grid=str(grid)):
+                self.assertEqual(
+                    count_removable_rolls(grid), rolls02.count_fork_accessible_rolls(grid)
+                )
+
+    def test_leaves_grid_untouched(self):
+        grid = PaddedGrid.from_rows(["@@@", "@.@", "@@@"])
+        before = bytes(grid.cells)
+        count_removable_rolls(grid)
+        self.assertEqual(bytes(grid.cells), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import random
+import unittest
+from importlib.util import find_spec
+
+from aoc.grid import PaddedGrid
+from day04 import rolls01, rolls02
+
+# numpy is optional, like the engine under test
+HAS_NUMPY = find_spec("numpy") is not None
+if HAS_NUMPY:
+    from day04.rolls_tiled import count_accessible, count_removable, shared_bands
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+class TestTiledRolls(unittest.TestCase):
+    def test_bands_match_sequential_solvers(self):
+        """Any number of bands and workers gives the sequential answers."""
+        rng = random.Random(4)
+        for _ in range(20):
+            width, height = rng.randrange(1, 12), rng.randrange(1, 16)
+            grid = PaddedGrid.from_rows(
+                "".join(rng.choice(".@@@") for _ in range(width)) for _ in range(height)
+            )
+            accessible = rolls01.count_fork_accessible_rolls(grid)
+            removable = rolls02.count_fork_accessible_rolls(grid)
+            for workers in (1, 3):
+                with self.subTest(workers=workers):
+                    self.assertEqual(count_accessible(grid, workers=workers), accessible)
+                    self.assertEqual(count_removable(grid, workers=workers), removable)
+
+    def test_halos_hold_neighboring_rows(self):
+        grid = PaddedGrid.from_rows(["@..", ".@.", "..@", "@@@"])
+        with shared_bands(grid, 2) as bands:
+            upper, lower = (band.mask for band in bands)
+            self.assertEqual(upper[-1].tolist(), [0, 0, 0, 1, 0])
+            self.assertEqual(lower[0].tolist(), [0, 0, 1, 0, 0])
+            self.assertEqual(upper[0].tolist(), [0] * 5)
+            self.assertEqual(lower[-1].tolist(), [0] * 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import random
+import unittest
+from importlib.util import find_spec
+from unittest import mock
+
+from aoc.grid import PaddedGrid
+from day04 import rolls02
+
+# numpy is optional, like the engine under test
+HAS_NUMPY = find_spec("numpy") is not None
+if HAS_NUMPY:
+    from day04 import rolls_waves
+
+
+def random_grid(rng, width, height):
+    return PaddedGrid.from_rows(
+        "".join(rng.choice(".@@@") for _ in range(width)) for _ in range(height)
+    )
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+class TestRollsWaves(unittest.TestCase):
+    def test_matches_reference(self):
+        rng = random.Random(24)
+        for _ in range(50):
+            grid = random_grid(rng, rng.randrange(1, 20), rng.randrange(1, 20))
+            with self.subTest(grid=str(grid)):
+                _, total = rolls_waves.remove_in_waves(grid)
+                self.assertEqual(total, rolls02.count_fork_accessible_rolls(grid))
+
+    def test_chunks_and_bands(self):
+        """Removals expanded a few at a time, counts taken a few rows at a time."""
+        grid = random_grid(random.Random(6), 17, 23)
+        expected = rolls02.count_fork_accessible_rolls(grid)
+        for chunk, rows in ((1, 1), (3, 2), (1 << 18, 1 << 10)):
+            with (
+                self.subTest(chunk=chunk, rows=rows),
+                mock.patch.object(rolls_waves, "CHUNK_ROLLS", chunk),
+                mock.patch.object(rolls_waves, "BAND_ROWS", rows),
+            ):
+                self.assertEqual(rolls_waves.solve(grid), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+"""
+Range merging shared by both parts of day 5.
+
+Part 2 merges the same fresh ranges as part 1. With ``merge_ranges`` defined
+once its cache key is the same in both parts, so part 2 reuses the merged
+ranges part 1 stored.
+"""
+
+from aoc.cache import artifact
+
+
+@artifact("day05.merge_ranges")
+def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    if not ranges:
+        return []
+
+    # Sort ranges by their start value
+    ranges.sort(key=lambda r: r[0])
+
+    merged = []
+    current_start, current_end = ranges[0]
+
+    for start, end in ranges[1:]:
+        if start <= current_end:  # Overlapping or contiguous ranges
+            current_end = max(current_end, end)
+        else:
+            merged.append((current_start, current_end))
+            current_start, current_end = start, end
+
+    # Append the last range
+    merged.append((current_start, current_end))
+
+    return merged
@@ -1,28 +1,14 @@
-import sys
+from aoc.input import (
+    Source,
+    decode_ints,
+    decode_ranges,
+    open_input,
+    source_from_argv,
+    split_sections,
+)
+from day05.merge import merge_ranges
 
 
-def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
-    if not ranges:
-        return []
-
-    # Sort ranges by their start value
-    ranges.sort(key=lambda r: r[0])
-
-    merged = []
-    current_start, current_end = ranges[0]
-
-    for start, end in ranges[1:]:
-        if start <= current_end:  # Overlapping or contiguous ranges
-            current_end = max(current_end, end)
-        else:
-            merged.append((current_start, current_end))
-            current_start, current_end = start, end
-
-    # Append the last range
-    merged.append((current_start, current_end))
-
-    return merged
-
 def count_fresh_ingredients(ranges: list[tuple[int, int]], ingredients: list[int]) -> int:
     ranges = merge_ranges(ranges)
     ingredients = sorted(ingredients)
@@ -40,28 +26,20 @@ def count_fresh_ingredients(ranges: list[tuple[int, int]], ingredients: list[int
     return fresh_count
 
 
-def parse_input() -> tuple[list[tuple[int, int]], list[int]]:
-    if len(sys.argv) > 1:
-        with open(sys.argv[1], "r", encoding="utf-8") as file:
-            lines = file.readlines()
-    else:
-        lines = sys.stdin.readlines()
-    
-    lines_iterator = iter(lines)
-    fresh_ranges = []
-    while line := next(lines_iterator).strip():
-        if line == "":
-            break
-        fresh_ranges.append(tuple(map(int, line.split("-"))))  # type: ignore
+def parse_input(source: Source = None) -> tuple[list[tuple[int, int]], list[int]]:
+    with open_input(source) as data:
+        fresh_section, ingredients_section = split_sections(data)
+
+    return decode_ranges(fresh_section), decode_ints(ingredients_section)
 
-    ingredients = [int(line.strip()) for line in lines_iterator]
 
-    return fresh_ranges, ingredients
+def solve(data: tuple[list[tuple[int, int]], list[int]]) -> int:
+    fresh_ranges, ingredients = data
+    return count_fresh_ingredients(fresh_ranges, ingredients)
 
 
 def main() -> None:
-    fresh_ranges, ingredients  = parse_input()
-    result = count_fresh_ingredients(fresh_ranges, ingredients)
+    result = solve(parse_input(source_from_argv()))
     print(result)
 
 
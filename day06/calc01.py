@@ -1,7 +1,8 @@
-import sys
 from functools import reduce
 from typing import Literal
 
+from aoc.input import Source, iter_lines, open_input, source_from_argv
+
 type Operator = Literal["+", "*"]
 
 
@@ -24,22 +25,23 @@ def compute_grand_total(columns: list[list[int]], operators: list[Operator]) ->
     return grand_total
 
 
-def parse_input() -> tuple[list[list[int]], list[Operator]]:
-    if len(sys.argv) > 1:
-        with open(sys.argv[1], "r", encoding="utf-8") as file:
-            lines = file.readlines()
-    else:
-        lines = sys.stdin.readlines()
+def parse_input(source: Source = None) -> tuple[list[list[int]], list[Operator]]:
+    with open_input(source) as data:
+        lines = [line for line in iter_lines(data) if line]
 
-    columns = [[int(value) for value in line.strip().split()] for line in lines[:-1]]
-    operators: list[Operator] = lines[-1].strip().split()  # type: ignore
+    columns = [[int(value) for value in line.split()] for line in lines[:-1]]
+    operators: list[Operator] = lines[-1].split()  # type: ignore
 
     return columns, operators
 
 
+def solve(data: tuple[list[list[int]], list[Operator]]) -> int:
+    columns, operators = data
+    return compute_grand_total(columns, operators)
+
+
 def main() -> None:
-    columns, operators = parse_input()
-    result = compute_grand_total(columns, operators)
+    result = solve(parse_input(source_from_argv()))
     print(result)
 
 
@@ -1,8 +1,9 @@
 from itertools import groupby
-import sys
 from functools import reduce
 from typing import Literal
 
+from aoc.input import Source, iter_records, open_input, source_from_argv
+
 type Operator = Literal["+", "*"]
 
 
@@ -45,22 +46,23 @@ def parse_number_groups(raw_lines: list[str]) -> list[list[int]]:
     ]
 
 
-def parse_input() -> tuple[list[list[int]], list[Operator]]:
-    if len(sys.argv) > 1:
-        with open(sys.argv[1], "r", encoding="utf-8") as file:
-            lines = file.readlines()
-    else:
-        lines = sys.stdin.readlines()
+def parse_input(source: Source = None) -> tuple[list[list[int]], list[Operator]]:
+    with open_input(source) as data:
+        lines = [record.decode() for record in iter_records(data)]
 
-    transposed_lines = transpone([line[:-1] for line in lines[:-1]])
+    transposed_lines = transpone(lines[:-1])
     operators: list[Operator] = list(reversed(lines[-1].split()))  # type: ignore
 
     return parse_number_groups(transposed_lines), operators
 
 
+def solve(data: tuple[list[list[int]], list[Operator]]) -> int:
+    number_groups, operators = data
+    return compute_grand_total(number_groups, operators)
+
+
 def main() -> None:
-    number_groups, operators = parse_input()
-    result = compute_grand_total(number_groups, operators)
+    result = solve(parse_input(source_from_argv()))
     print(result)
 
 
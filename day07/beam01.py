@@ -1,23 +1,24 @@
-import sys
+from aoc.grid import PaddedGrid
+from aoc.input import Source, decode_grid, open_input, source_from_argv
 
+SPLITTER = ord("^")
 
-def count_beam_splits(map_: list[str]) -> int:
-    start_line = map_[0]
-    beam_positions = {start_line.find("S")}
+
+def count_beam_splits(map_: PaddedGrid) -> int:
+    cells = map_.cells
+    # beams are tracked by their column in the padded rows; a beam split into
+    # the padding never meets a splitter again
+    beam_positions = {map_.pad + map_.row(0).tobytes().find(b"S")}
     split_count = 0
 
-    for line in map_[1:]:
+    for y in range(1, map_.height):
+        line_start = map_.index(-map_.pad, y)
         new_beam_positions = set()
         for position in beam_positions:
-            if line[position] == "^":
+            if cells[line_start + position] == SPLITTER:
                 split_count += 1
-                left_pos = position - 1
-                right_pos = position + 1
-
-                if left_pos >= 0:
-                    new_beam_positions.add(left_pos)
-                if right_pos < len(line):
-                    new_beam_positions.add(right_pos)
+                new_beam_positions.add(position - 1)
+                new_beam_positions.add(position + 1)
             else:
                 new_beam_positions.add(position)
         beam_positions = new_beam_positions
@@ -25,19 +26,18 @@ def count_beam_splits(map_: list[str]) -> int:
     return split_count
 
 
-def parse_input() -> list[str]:
-    if len(sys.argv) > 1:
-        with open(sys.argv[1], "r", encoding="utf-8") as file:
-            lines = file.readlines()
-    else:
-        lines = sys.stdin.readlines()
+def parse_input(source: Source = None) -> PaddedGrid:
+    with open_input(source) as data:
+        return PaddedGrid.from_rows(decode_grid(data))
+
 
-    return [line.strip() for line in lines]
+def solve(map_: PaddedGrid) -> int:
+    return count_beam_splits(map_)
 
 
 def main() -> None:
-    map_ = parse_input()
-    result = count_beam_splits(map_)
+    map_ = parse_input(source_from_argv())
+    result = solve(map_)
     print(result)
 
 
@@ -1,47 +1,46 @@
-import sys
+from aoc.grid import PaddedGrid
+from aoc.input import Source, decode_grid, open_input, source_from_argv
 
+SPLITTER = ord("^")
 
-def bump_dynamic_map_count(line: list[str | int], index: int, count: int) -> None:
-    if index < 0 or index >= len(line):
-        return
 
-    if type(line[index]) is int:  # pylint: disable=unidiomatic-typecheck
-        line[index] += count  # type: ignore
-    else:
-        line[index] = count
+def count_beam_splits(map_: PaddedGrid) -> int:
+    cells = map_.cells
+    # timelines per column of the padded rows
+    counts = [0] * map_.stride
+    counts[map_.pad + map_.row(0).tobytes().find(b"S")] = 1
 
+    for y in range(1, map_.height):
+        line_start = map_.index(-map_.pad, y)
+        new_counts = [0] * map_.stride
+        for position, count in enumerate(counts):
+            if not count:
+                continue
+            # a splitter already reached by the split on its left is covered
+            # by that beam and lets this one through
+            if cells[line_start + position] == SPLITTER and not new_counts[position]:
+                new_counts[position - 1] += count
+                new_counts[position + 1] += count
+            else:
+                new_counts[position] += count
+        counts = new_counts
 
-def count_beam_splits(map_: list[str]) -> int:
-    dynamic_map: list[list[str | int]] = [list(line) for line in map_]
-    prev_line = [1 if c == "S" else c for c in dynamic_map[0]]
+    # timelines that left the grid sideways are not counted
+    return sum(counts[map_.pad : map_.pad + map_.width])
 
-    for line in dynamic_map[1:]:
-        for i, character in enumerate(line):
-            if type(prev_line[i]) is int:  # pylint: disable=unidiomatic-typecheck
-                count: int = prev_line[i]  # type: ignore
-                if character == "^":
-                    bump_dynamic_map_count(line, i - 1, count)
-                    bump_dynamic_map_count(line, i + 1, count)
-                else:
-                    bump_dynamic_map_count(line, i, count)
-        prev_line = line
 
-    return sum(c for c in prev_line if type(c) is int)  # type: ignore, pylint: disable=unidiomatic-typecheck
+def parse_input(source: Source = None) -> PaddedGrid:
+    with open_input(source) as data:
+        return PaddedGrid.from_rows(decode_grid(data))
 
 
-def parse_input() -> list[str]:
-    if len(sys.argv) > 1:
-        with open(sys.argv[1], "r", encoding="utf-8") as file:
-            lines = file.readlines()
-    else:
-        lines = sys.stdin.readlines()
-
-    return [line.strip() for line in lines]
+def solve(map_: PaddedGrid) -> int:
+    return count_beam_splits(map_)
 
 
 def main() -> None:
-    map_ = parse_input()
-    result = count_beam_splits(map_)
+    map_ = parse_input(source_from_argv())
+    result = solve(map_)
     print(result)
 
 
@@ -0,0 +1,42 @@
+"""
+Pairwise junction box distances shared by both parts of day 8.
+
+Both parts start from the same sorted distances, so ``sort_distances`` lives
+here: one module means one ``code_version`` and one cache entry for both.
+"""
+
+import math
+
+from aoc import instrument
+from aoc.cache import artifact
+
+type Box = tuple[int, int, int]
+type Point3d = tuple[float | int, float | int, float | int]
+
+
+def calculate_3d_distance(point1: Point3d, point2: Point3d) -> float:
+    return math.sqrt(
+        (point2[0] - point1[0]) ** 2
+        + (point2[1] - point1[1]) ** 2
+        + (point2[2] - point1[2]) ** 2
+    )
+
+
+def calculate_distances(boxes: list[Box]) -> dict[str, float]:
+    """
+    >>> calculate_distances([(0, 0, 0), (2, 3, 6), (-2, 3, 6)])
+    {'0-1': 7.0, '0-2': 7.0, '1-2': 4.0}
+    """
+    distances = {}
+    for i, box in enumerate(boxes[:-1]):
+        for j, other_box in enumerate(boxes[i + 1 :], start=i + 1):
+            distances[f"{i}-{j}"] = calculate_3d_distance(box, other_box)
+    return distances
+
+
+@artifact("day08.sorted_distances")
+def sort_distances(boxes: list[Box]) -> list[tuple[str, float]]:
+    """Pairwise distances, longest first so the shortest can be popped."""
+    with instrument.span("calculate distances"):
+        distances = calculate_distances(boxes)
+    return sorted(distances.items(), key=lambda item: item[1], reverse=True)
@@ -1,6 +1,8 @@
-import sys
 from itertools import combinations
 
+from aoc.grid import PaddedGrid
+from aoc.input import Source, decode_int_tuples, open_input, source_from_argv
+
 type Point2d = tuple[int, int]
 
 
@@ -19,29 +21,27 @@ def print_map(rectangles: list[Point2d]) -> None:
     max_x = max(x for x, _ in rectangles)
     max_y = max(y for _, y in rectangles)
 
-    grid = [["." for _ in range(max_x + 3)] for _ in range(max_y + 2)]
+    grid = PaddedGrid(max_x + 3, max_y + 2, pad=0)
 
     for x, y in rectangles:
-        grid[y][x] = "#"
+        grid.set(x, y, "#")
+
+    print(grid)
 
-    for row in grid:
-        print("".join(row))
 
+def parse_input(source: Source = None) -> list[Point2d]:
+    with open_input(source) as data:
+        return decode_int_tuples(data)  # type: ignore
 
-def parse_input() -> list[Point2d]:
-    if len(sys.argv) > 1:
-        with open(sys.argv[1], "r", encoding="utf-8") as file:
-            lines = file.readlines()
-    else:
-        lines = sys.stdin.readlines()
 
-    return [tuple(map(int, line.strip().split(","))) for line in lines]  # type: ignore
+def solve(rectangles: list[Point2d]) -> int:
+    return calculate_max_rectangle_area(rectangles)
 
 
 def main() -> None:
-    rectangles = parse_input()
+    rectangles = parse_input(source_from_argv())
     print_map(rectangles)
-    max_rect_area = calculate_max_rectangle_area(rectangles)
+    max_rect_area = solve(rectangles)
     print(max_rect_area)
 
 
@@ -1,27 +1,15 @@
-import sys
 from itertools import combinations
 
+from aoc.input import Source, decode_int_tuples, open_input, source_from_argv
+
 # Type alias for clarity
 type Point2d = tuple[int, int]
 
 
-def parse_input() -> list[Point2d]:
+def parse_input(source: Source = None) -> list[Point2d]:
     """Reads coordinate pairs from file or stdin."""
-    lines = []
-    if len(sys.argv) > 1:
-        with open(sys.argv[1], "r", encoding="utf-8") as file:
-            lines = file.readlines()
-    else:
-        lines = sys.stdin.readlines()
-
-    # Filter out empty lines and parse
-    points = []
-    for line in lines:
-        line = line.strip()
-        if line:
-            parts = line.split(",")
-            points.append((int(parts[0]), int(parts[1])))
-    return points
+    with open_input(source) as data:
+        return decode_int_tuples(data)  # type: ignore
 
 
 def is_point_in_polygon(x: float, y: float, poly: list[Point2d]) -> bool:
@@ -83,11 +71,7 @@ def edge_intersects_rect(
     return False
 
 
-def main() -> None:
-    poly = parse_input()
-    if not poly:
-        return
-
+def calculate_max_rectangle_area(poly: list[Point2d]) -> int:
     max_area = 0
 
     # Iterate all pairs of vertices to form candidate rectangles
@@ -123,7 +107,19 @@ def main() -> None:
         # If passed both checks, it is a valid sub-rectangle
         max_area = current_area
 
-    print(max_area)
+    return max_area
+
+
+def solve(poly: list[Point2d]) -> int:
+    return calculate_max_rectangle_area(poly)
+
+
+def main() -> None:
+    poly = parse_input(source_from_argv())
+    if not poly:
+        return
+
+    print(solve(poly))
 
 
 if __name__ == "__main__":
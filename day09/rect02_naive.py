@@ -3,6 +3,10 @@ import re
 import sys
 from itertools import combinations
 
+from aoc import instrument
+from aoc.grid import PaddedGrid
+from aoc.input import Source, decode_int_tuples, open_input, source_from_argv
+
 type Point2d = tuple[int, int]
 
 
@@ -36,18 +40,28 @@ def calculate_max_rectangle_area(rectangles: list[Point2d]) -> int:
     rect_combinations = combinations(rectangles, 2)
     size_of_rect_combinations = math.comb(len(rectangles), 2)
     inside_rects: list[tuple[Point2d, Point2d]] = []
+    polygon_checks = 0
 
     for i, rect in enumerate(rect_combinations):
         # use ncurses to print status of current iteration
-        print(f"Processing item {i + 1} of {size_of_rect_combinations}...", end='\r', flush=True)
+        print(
+            f"Processing item {i + 1} of {size_of_rect_combinations}...",
+            end="\r",
+            flush=True,
+            file=sys.stderr,
+        )
 
         rect_boundary = rectangle_edge_tiles(rect[0], rect[1])
         for point in rect_boundary:
+            polygon_checks += 1
             if point_in_polygon_grid(point, rectangles) == -1:
                 break
         else:
             inside_rects.append(rect)
-    print()  # newline after progress output
+    print(file=sys.stderr)  # newline after progress output
+
+    instrument.count("rect02_naive.point_in_polygon_calls", polygon_checks)
+    instrument.count("rect02_naive.inside_rectangles", len(inside_rects))
 
     return max(
         math.prod((rect2[0] - rect1[0] - 1, rect2[1] - rect1[1] - 1))
@@ -108,26 +122,26 @@ def print_filled_polygon(poly: list[Point2d], offset: int = 1) -> None:
     width = max_x + offset + 1
     height = max_y + offset + 1
 
+    grid = PaddedGrid(width, height, pad=0)
     for y in range(height):
-        row_chars = []
         for x in range(width):
-            state = point_in_polygon_grid((x, y), poly)
-            row_chars.append("#" if state >= 0 else ".")
-        print("".join(row_chars))
+            if point_in_polygon_grid((x, y), poly) >= 0:
+                grid.set(x, y, "#")
+    print(grid)
+
+
+def parse_input(source: Source = None) -> list[Point2d]:
+    with open_input(source) as data:
+        return decode_int_tuples(data)  # type: ignore
 
-def parse_input() -> list[Point2d]:
-    if len(sys.argv) > 1:
-        with open(sys.argv[1], "r", encoding="utf-8") as file:
-            lines = file.readlines()
-    else:
-        lines = sys.stdin.readlines()
 
-    return [tuple(map(int, line.strip().split(","))) for line in lines]  # type: ignore
+def solve(rectangles: list[Point2d]) -> int:
+    return calculate_max_rectangle_area(rectangles)
 
 
 def main() -> None:
-    rectangles = parse_input()
-    max_rect_area = calculate_max_rectangle_area(rectangles)
+    rectangles = parse_input(source_from_argv())
+    max_rect_area = solve(rectangles)
     print(max_rect_area)
 
 
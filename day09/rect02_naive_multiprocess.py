@@ -3,6 +3,9 @@ import multiprocessing
 import sys
 from itertools import combinations
 
+from aoc.grid import PaddedGrid
+from aoc.input import Source, decode_int_tuples, open_input, source_from_argv
+
 type Point2d = tuple[int, int]
 
 
@@ -73,10 +76,11 @@ def calculate_max_rectangle_area(rectangles: list[Point2d]) -> int:
         rect_combinations[i : i + chunk_size]
         for i in range(0, total_combinations, chunk_size)
     ]
-    print("Chunk_size:", chunk_size)
+    print("Chunk_size:", chunk_size, file=sys.stderr)
 
     print(
-        f"Splitting {total_combinations} items into {len(chunks)} chunks for {cpu_count} processes."
+        f"Splitting {total_combinations} items into {len(chunks)} chunks for {cpu_count} processes.",
+        file=sys.stderr,
     )
 
     # 4. Process in parallel
@@ -154,27 +158,26 @@ def print_filled_polygon(poly: list[Point2d], offset: int = 1) -> None:
     width = max_x + offset + 1
     height = max_y + offset + 1
 
+    grid = PaddedGrid(width, height, pad=0)
     for y in range(height):
-        row_chars = []
         for x in range(width):
-            state = point_in_polygon_grid((x, y), poly)
-            row_chars.append("#" if state >= 0 else ".")
-        print("".join(row_chars))
+            if point_in_polygon_grid((x, y), poly) >= 0:
+                grid.set(x, y, "#")
+    print(grid)
+
 
+def parse_input(source: Source = None) -> list[Point2d]:
+    with open_input(source) as data:
+        return decode_int_tuples(data)  # type: ignore
 
-def parse_input() -> list[Point2d]:
-    if len(sys.argv) > 1:
-        with open(sys.argv[1], "r", encoding="utf-8") as file:
-            lines = file.readlines()
-    else:
-        lines = sys.stdin.readlines()
 
-    return [tuple(map(int, line.strip().split(","))) for line in lines]  # type: ignore
+def solve(rectangles: list[Point2d]) -> int:
+    return calculate_max_rectangle_area(rectangles)
 
 
 def main() -> None:
-    rectangles = parse_input()
-    max_rect_area = calculate_max_rectangle_area(rectangles)
+    rectangles = parse_input(source_from_argv())
+    max_rect_area = solve(rectangles)
     print(max_rect_area)
 
 